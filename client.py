@@ -0,0 +1,354 @@
+# Copyright 2025 Google, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Caching client for the published Exemplar API endpoint.
+
+Fetches data-min.json.gz over a persistent HTTP connection and keeps the
+response in a local disk cache with its ETag and Last-Modified validators.
+Later fetches revalidate with a conditional request, and the data are only
+decompressed and parsed again when the endpoint content has changed.
+"""
+
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from resolver import LocaleResolver
+
+# Published endpoint of the gzip compressed, minified locale data
+DEFAULT_URL: str = (
+    "https://cdn.jsdelivr.net/gh/googlefonts/exemplar@1/api/data-min.json.gz"
+)
+
+# Default directory of the disk cache
+DEFAULT_CACHE_DIR: Path = Path(
+    os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "exemplar"
+
+# Default number of seconds during which the loaded data are not revalidated
+DEFAULT_MAX_AGE: float = 300.0
+
+# Default timeout of the HTTP requests in seconds
+DEFAULT_TIMEOUT: float = 30.0
+
+# Shared clients by URL, see get_client
+_CLIENTS: Dict[str, "ExemplarClient"] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+class ExemplarClient:
+    """
+    Client for the Exemplar API data with a disk cache and conditional requests.
+
+    Parameters:
+    url (str): The URL of the gzip compressed locale data.
+    cache_dir (Optional[str]): Directory of the disk cache.
+    max_age (float): Seconds during which the loaded data are used without
+        revalidation.  Use 0 to revalidate on each lookup.
+    timeout (float): Timeout of the HTTP requests in seconds.
+    """
+
+    def __init__(
+        self,
+        url: str = DEFAULT_URL,
+        cache_dir: Optional[str] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.url = url
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_age = max_age
+        self.timeout = timeout
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme {parts.scheme}")
+        self._scheme = parts.scheme
+        self._host = parts.hostname or ""
+        self._port = parts.port
+        self._path = parts.path + (f"?{parts.query}" if parts.query else "")
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        self._body_path = self.cache_dir / f"{key}.json.gz"
+        self._meta_path = self.cache_dir / f"{key}.meta.json"
+        self._connection: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Any]] = None
+        self._data_etag: Optional[str] = None
+        self._resolver: Optional[LocaleResolver] = None
+        self._resolver_data: Optional[Dict[str, Any]] = None
+        self._validated_at = 0.0
+
+    def close(self) -> None:
+        """
+        Close the persistent HTTP connection.
+        """
+        with self._lock:
+            self._disconnect()
+
+    def __enter__(self) -> "ExemplarClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self._connection is None:
+            if self._scheme == "https":
+                self._connection = http.client.HTTPSConnection(
+                    self._host, self._port, timeout=self.timeout
+                )
+            else:
+                self._connection = http.client.HTTPConnection(
+                    self._host, self._port, timeout=self.timeout
+                )
+        return self._connection
+
+    def _request(self, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        """
+        Send a GET request on the persistent connection.
+        """
+        try:
+            return self._send(headers)
+        except (http.client.HTTPException, ConnectionError):
+            # the server may close an idle keep-alive connection, retry once
+            return self._send(headers)
+
+    def _send(self, headers: Dict[str, str]) -> http.client.HTTPResponse:
+        connection = self._connect()
+        try:
+            connection.request("GET", self._path, headers=headers)
+            return connection.getresponse()
+        except (OSError, http.client.HTTPException):
+            self._disconnect()
+            raise
+
+    def _disconnect(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def _read_meta(self) -> Dict[str, Any]:
+        try:
+            with self._meta_path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, body: bytes, meta: Dict[str, Any]) -> None:
+        """
+        Write the response body and validators to the disk cache atomically.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for path, content in (
+            (self._body_path, body),
+            (self._meta_path, json.dumps(meta).encode("utf-8")),
+        ):
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+    def _load(self, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decompress and parse the cached body, unless it is already loaded.
+        """
+        etag = meta.get("etag") or meta.get("sha256")
+        if self._data is None or etag != self._data_etag:
+            with gzip.open(self._body_path, "rt", encoding="utf-8") as f:
+                self._data = json.load(f)
+            self._data_etag = etag
+        return self._data
+
+    def fetch(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Retrieve the locale data, revalidating the cached copy with the endpoint.
+
+        The cached data are used when the endpoint responds 304 Not Modified,
+        when it responds with a server error, and when it cannot be reached.
+
+        Parameters:
+        force (bool): Whether to revalidate even within max_age.
+
+        Returns:
+        Dict[str, Any]: Dictionary containing locale data.
+        """
+        with self._lock:
+            meta = self._read_meta() if self._body_path.exists() else {}
+            fresh = time.monotonic() - self._validated_at < self.max_age
+            if meta and self._data is not None and fresh and not force:
+                return self._data
+
+            headers = {"Accept-Encoding": "identity"}
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+            try:
+                response = self._request(headers)
+                body = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                self._disconnect()
+                if not meta:
+                    raise
+                sys.stderr.write(f"Using cached data for {self.url}: {e}\n")
+                self._validated_at = time.monotonic()
+                return self._load(meta)
+
+            if response.status == 304 and meta:
+                self._validated_at = time.monotonic()
+                return self._load(meta)
+            if response.status >= 500 and meta:
+                sys.stderr.write(
+                    f"Using cached data for {self.url}: HTTP {response.status}\n"
+                )
+                self._validated_at = time.monotonic()
+                return self._load(meta)
+            if response.status != 200:
+                raise OSError(f"GET {self.url} failed with HTTP {response.status}")
+            meta = {
+                "url": self.url,
+                "etag": response.getheader("ETag"),
+                "last_modified": response.getheader("Last-Modified"),
+                "sha256": hashlib.sha256(body).hexdigest(),
+            }
+            self._write_cache(body, meta)
+            self._validated_at = time.monotonic()
+            return self._load(meta)
+
+    def resolve_locale_id(self, localeID: str) -> Optional[str]:
+        """
+        Resolve a locale identifier to a locale ID of the data.
+
+        Parameters:
+        localeID (str): The locale identifier, e.g. fr-CA or pt_br.
+
+        Returns:
+        Optional[str]: The locale ID, or None if the locale is not in the data.
+        """
+        return self._resolve(self.fetch(), localeID)
+
+    def _resolve(self, data: Dict[str, Any], localeID: str) -> Optional[str]:
+        # the resolver is rebuilt when the data have changed
+        if self._resolver is None or self._resolver_data is not data:
+            self._resolver = LocaleResolver.from_locale_ids(data["locales"])
+            self._resolver_data = data
+        return self._resolver.resolve(localeID, fallback=False)
+
+    def get_locale_data(self, localeID: str) -> Dict[str, Any]:
+        """
+        Retrieve the locale data record of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+
+        Returns:
+        Dict[str, Any]: The locale record, or an empty dictionary if not found.
+        """
+        data = self.fetch()
+        resolved = self._resolve(data, localeID)
+        return data["locales"][resolved] if resolved is not None else {}
+
+    def get_display_name(self, localeID: str) -> str:
+        """
+        Retrieve the display name of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+
+        Returns:
+        str: The display name, or "Unknown Locale" if not found.
+        """
+        data = self.fetch()
+        resolved = self._resolve(data, localeID)
+        return data["display_names"].get(resolved, "Unknown Locale")
+
+    def get_exemplars(self, localeID: str, category: str = "main") -> List[str]:
+        """
+        Retrieve the single character exemplars of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+        category (str): The exemplar category (main, auxiliary, case_insensitive,
+            case_mapping).
+
+        Returns:
+        List[str]: The single character exemplars.
+        """
+        categorized = self.get_locale_data(localeID).get(category) or {}
+        return categorized.get("single_chars") or []
+
+    def get_digits(self, localeID: str) -> List[str]:
+        """
+        Retrieve the number digits of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+
+        Returns:
+        List[str]: The digits zero to nine.
+        """
+        return self.get_locale_data(localeID).get("numbers", {}).get("digits", [])
+
+    def get_punctuation(self, localeID: str) -> List[str]:
+        """
+        Retrieve the punctuation exemplars of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+
+        Returns:
+        List[str]: The punctuation exemplars.
+        """
+        return self.get_locale_data(localeID).get("punctuation") or []
+
+    def get_currency(self, localeID: str) -> Optional[str]:
+        """
+        Retrieve the currency symbol of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+
+        Returns:
+        Optional[str]: The currency symbol, or None if not available.
+        """
+        return self.get_locale_data(localeID).get("currency")
+
+
+def get_client(url: str = DEFAULT_URL, **kwargs: Any) -> ExemplarClient:
+    """
+    Retrieve the shared client of a URL, creating it on first use.
+
+    Sharing the client within a process reuses its HTTP connection and the
+    parsed data.
+
+    Parameters:
+    url (str): The URL of the gzip compressed locale data.
+    **kwargs (Any): ExemplarClient arguments used when the client is created.
+
+    Returns:
+    ExemplarClient: The shared client.
+    """
+    with _CLIENTS_LOCK:
+        if url not in _CLIENTS:
+            _CLIENTS[url] = ExemplarClient(url, **kwargs)
+        return _CLIENTS[url]
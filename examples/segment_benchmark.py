@@ -0,0 +1,113 @@
+import random
+import sys
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scanner import get_category_exemplars, load_locale_data  # noqa: E402
+from segmenter import DEFAULT_IGNORE, get_matcher  # noqa: E402
+
+# Locales with multi-character sequences in their main exemplars
+LOCALES: Tuple[str, ...] = ("sk", "hu", "cy", "as", "ln")
+
+# Size of the generated text per locale in megabytes
+TEXT_MB: int = 4
+
+# Categories of the exemplar units
+CATEGORIES: Tuple[str, ...] = ("case_insensitive", "punctuation", "digits")
+
+
+def generate_text(exemplars: Sequence[str], size: int, seed: int = 0) -> str:
+    """
+    Generate words of exemplar units with occasional non-exemplar characters.
+    """
+    rng = random.Random(seed)
+    units = list(exemplars)
+    words = []
+    length = 0
+    while length < size:
+        word = "".join(rng.choices(units, k=rng.randint(2, 8)))
+        if rng.random() < 0.02:
+            word += rng.choice("ΩЖ☃ø")
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)
+
+
+def naive_nonexemplars(
+    text: str, exemplars: Sequence[str]
+) -> List[Tuple[int, int]]:
+    """
+    Find the non-exemplar spans by trying the exemplar list at every position.
+    """
+    by_length = sorted(exemplars, key=len, reverse=True)
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+    while pos < len(text):
+        if text[pos] in DEFAULT_IGNORE:
+            pos += 1
+            continue
+        for exemplar in by_length:
+            if text.startswith(exemplar, pos):
+                pos += len(exemplar)
+                break
+        else:
+            if spans and spans[-1][1] == pos:
+                spans[-1] = (spans[-1][0], pos + 1)
+            else:
+                spans.append((pos, pos + 1))
+            pos += 1
+    return spans
+
+
+def benchmark(data: Dict[str, Any], localeID: str) -> None:
+    """
+    Compare the naive scan with the compiled matcher on a generated text.
+    """
+    exemplars = sorted(
+        {
+            unicodedata.normalize("NFC", exemplar)
+            for category in CATEGORIES
+            for exemplar in get_category_exemplars(data["locales"][localeID], category)
+        }
+    )
+    text = generate_text(exemplars, TEXT_MB * 1024 * 1024)
+
+    start = time.perf_counter()
+    matcher = get_matcher(data, localeID, CATEGORIES)
+    compile_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    spans = matcher.find_nonexemplars(text)
+    find_s = time.perf_counter() - start
+    start = time.perf_counter()
+    segments = matcher.segment(text)
+    segment_s = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = naive_nonexemplars(text, exemplars)
+    naive_s = time.perf_counter() - start
+
+    flagged = [(start, end) for start, end, exemplar in segments if not exemplar]
+    if spans != expected or flagged != expected:
+        sys.stderr.write(f"Mismatched spans for {localeID}\n")
+        sys.exit(1)
+    print(
+        f"{localeID:<8} {len(exemplars):>6} {compile_ms:>10.1f} "
+        f"{TEXT_MB / find_s:>10.1f} {TEXT_MB / segment_s:>10.1f} "
+        f"{TEXT_MB / naive_s:>10.2f} {len(spans):>7}"
+    )
+
+
+if __name__ == "__main__":
+    data_path = Path(__file__).resolve().parent.parent / "api" / "data.json"
+    data = load_locale_data(str(data_path))
+    print(f"Text size: {TEXT_MB} MB per locale, throughput in MB/s\n")
+    print(
+        f"{'Locale':<8} {'Units':>6} {'Compile ms':>10} {'Find':>10} "
+        f"{'Segment':>10} {'Naive':>10} {'Spans':>7}"
+    )
+    print("=" * 67)
+    for localeID in LOCALES:
+        benchmark(data, localeID)
@@ -0,0 +1,156 @@
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Example queries against the data.sqlite database, with the equivalent scans
+# of the data.json locale data.
+QUERIES: Dict[str, str] = {
+    "decimal ',' with non-latn digits": """
+        SELECT n.locale_id FROM number_symbols n
+        JOIN digits d ON d.locale_id = n.locale_id AND d.value = 0
+        WHERE n.symbol = 'decimal' AND n.value = ',' AND d.digit <> '0'
+        ORDER BY n.locale_id
+    """,
+    "decimal '٫' with non-latn digits": """
+        SELECT n.locale_id FROM number_symbols n
+        JOIN digits d ON d.locale_id = n.locale_id AND d.value = 0
+        WHERE n.symbol = 'decimal' AND n.value = '٫' AND d.digit <> '0'
+        ORDER BY n.locale_id
+    """,
+    "main exemplars with sequence 'ch'": """
+        SELECT locale_id FROM exemplars
+        WHERE exemplar = 'ch' AND category = 'main'
+        ORDER BY locale_id
+    """,
+    "auxiliary exemplars with U+00E9": """
+        SELECT locale_id FROM exemplars
+        WHERE codepoint = 0xE9 AND category = 'auxiliary'
+        ORDER BY locale_id
+    """,
+    "currency symbol '€'": """
+        SELECT locale_id FROM currencies WHERE symbol = '€' ORDER BY locale_id
+    """,
+}
+
+
+def scan_decimal_digits(data: Dict[str, Any], decimal: str = ",") -> List[str]:
+    """
+    Find the locales whose decimal is the given separator and whose digits are
+    not latn.
+    """
+    return sorted(
+        locale
+        for locale, locale_data in data["locales"].items()
+        if locale_data["numbers"]["decimal"] == decimal
+        and locale_data["numbers"]["digits"][0] != "0"
+    )
+
+
+def scan_arabic_decimal_digits(data: Dict[str, Any]) -> List[str]:
+    """
+    Find the locales whose decimal is '٫' and whose digits are not latn.
+    """
+    return scan_decimal_digits(data, "٫")
+
+
+def scan_main_sequence(data: Dict[str, Any]) -> List[str]:
+    """
+    Find the locales whose main exemplars contain the sequence 'ch'.
+    """
+    return sorted(
+        locale
+        for locale, locale_data in data["locales"].items()
+        if "ch" in (locale_data["main"]["sequences"] or [])
+    )
+
+
+def scan_auxiliary_codepoint(data: Dict[str, Any]) -> List[str]:
+    """
+    Find the locales whose auxiliary exemplars contain U+00E9.
+    """
+    return sorted(
+        locale
+        for locale, locale_data in data["locales"].items()
+        if "é" in (locale_data["auxiliary"]["single_chars"] or [])
+    )
+
+
+def scan_currency(data: Dict[str, Any]) -> List[str]:
+    """
+    Find the locales whose currency symbol is '€'.
+    """
+    return sorted(
+        locale
+        for locale, locale_data in data["locales"].items()
+        if locale_data["currency"] == "€"
+    )
+
+
+SCANS: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {
+    "decimal ',' with non-latn digits": scan_decimal_digits,
+    "decimal '٫' with non-latn digits": scan_arabic_decimal_digits,
+    "main exemplars with sequence 'ch'": scan_main_sequence,
+    "auxiliary exemplars with U+00E9": scan_auxiliary_codepoint,
+    "currency symbol '€'": scan_currency,
+}
+
+
+def timed(function: Callable[[], Any], repeat: int = 20) -> float:
+    """
+    Measure the best run time of a function in milliseconds.
+
+    Parameters:
+    function (Callable[[], Any]): The function to measure.
+    repeat (int): The number of runs.
+
+    Returns:
+    float: The best run time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def compare_queries(json_path: Path, sqlite_path: Path) -> None:
+    """
+    Run the example queries and the equivalent JSON scans, and print their timing.
+
+    The JSON timing excludes loading data.json, which is reported separately.
+
+    Parameters:
+    json_path (Path): The path to the data.json file.
+    sqlite_path (Path): The path to the data.sqlite file.
+    """
+    start = time.perf_counter()
+    with open(json_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    load_ms = (time.perf_counter() - start) * 1000
+    connection = sqlite3.connect(f"file:{sqlite_path}?mode=ro", uri=True)
+
+    print(f"data.json load: {load_ms:.1f} ms\n")
+    print(f"{'Query':<36} {'Rows':>5} {'SQLite ms':>10} {'JSON ms':>10}")
+    print("=" * 64)
+    for name, query in QUERIES.items():
+        rows = [row[0] for row in connection.execute(query)]
+        if rows != SCANS[name](data):
+            sys.stderr.write(f"Mismatched results for {name}\n")
+            sys.exit(1)
+        sqlite_ms = timed(lambda: connection.execute(query).fetchall())
+        json_ms = timed(lambda: SCANS[name](data))
+        print(f"{name:<36} {len(rows):>5} {sqlite_ms:>10.3f} {json_ms:>10.3f}")
+    connection.close()
+
+
+if __name__ == "__main__":
+    api_dir = Path(__file__).parent.parent / "api"
+    sqlite_path = api_dir / "data.sqlite"
+    if not sqlite_path.exists():
+        print("Error: generate data.sqlite with: python exemplars.py --sqlite")
+        sys.exit(1)
+    compare_queries(api_dir / "data.json", sqlite_path)
@@ -12,17 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+import functools
 import gzip
 import json
+import lzma
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import babel
 from babel.numbers import get_currency_symbol
 import icu
 import jsonschema
 
+from resolver import LocaleResolver, resolution_key
+
+try:
+    from compression import zstd
+except ImportError:  # Python < 3.14
+    zstd = None
+
 # Mapping of exemplar types to their corresponding integer values used by ICU
 EXEMPLAR_TYPES: Dict[str, int] = {
     "main": 0,
@@ -34,6 +47,71 @@ EXEMPLAR_TYPES: Dict[str, int] = {
 # List of valid options for exemplar sets
 OPTIONS: List[int] = [0, 2, 4]
 
+# Deprecated and legacy language codes that are added to the resolution table
+LEGACY_LANGUAGE_CODES: List[str] = ["in", "iw", "ji", "jw", "mo", "no", "sh", "tl"]
+
+# Mapping of the locale data exemplar categories to their exemplar type and option
+EXEMPLAR_CATEGORIES: Dict[str, Tuple[str, int]] = {
+    "main": ("main", 0),
+    "auxiliary": ("auxiliary", 0),
+    "punctuation": ("punctuation", 0),
+    "case_insensitive": ("main", 2),
+    "case_mapping": ("main", 4),
+}
+
+# Tables and indexes of the SQLite database artifact
+SQLITE_SCHEMA: str = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE locales (
+    locale_id TEXT PRIMARY KEY,
+    display_name TEXT,
+    language TEXT NOT NULL
+);
+CREATE TABLE exemplars (
+    locale_id TEXT NOT NULL REFERENCES locales (locale_id),
+    category TEXT NOT NULL,
+    type TEXT NOT NULL,
+    option INTEGER NOT NULL,
+    exemplar TEXT NOT NULL,
+    codepoint INTEGER,
+    is_sequence INTEGER NOT NULL,
+    rank INTEGER NOT NULL
+);
+CREATE TABLE number_symbols (
+    locale_id TEXT NOT NULL REFERENCES locales (locale_id),
+    symbol TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (locale_id, symbol)
+);
+CREATE TABLE digits (
+    locale_id TEXT NOT NULL REFERENCES locales (locale_id),
+    value INTEGER NOT NULL,
+    digit TEXT NOT NULL,
+    codepoint INTEGER NOT NULL,
+    PRIMARY KEY (locale_id, value)
+);
+CREATE TABLE currencies (
+    locale_id TEXT PRIMARY KEY REFERENCES locales (locale_id),
+    symbol TEXT NOT NULL
+);
+"""
+
+SQLITE_INDEXES: str = """
+CREATE INDEX exemplars_locale ON exemplars (locale_id, category);
+CREATE INDEX exemplars_codepoint ON exemplars (codepoint, category);
+CREATE INDEX exemplars_exemplar ON exemplars (exemplar, category);
+CREATE INDEX number_symbols_symbol ON number_symbols (symbol, value);
+CREATE INDEX digits_digit ON digits (digit);
+CREATE INDEX currencies_symbol ON currencies (symbol);
+"""
+
+# Exemplar categories that are counted in the per-script aggregates
+SCRIPT_AGGREGATE_CATEGORIES: List[str] = ["main", "auxiliary", "punctuation"]
+
+# Compression codecs and levels of the precompressed data-min.json files that
+# are always written, as data-min.json.gz is the published endpoint
+DEFAULT_CODECS: Dict[str, int] = {"gzip": 9}
+
 
 def normalize_locale_id(localeID: str) -> str:
     """
@@ -66,21 +144,14 @@ def get_exemplars(localeID: str, extype: str = "main", option: int = 0) -> List[
     Returns:
     List[str]: Sorted list of exemplars.
     """
-    option = option if option in OPTIONS else 0
-    extype = extype.lower() if extype.lower() in EXEMPLAR_TYPES else "main"
-    localeID = normalize_locale_id(localeID)
+    localeID = resolve_locale_id(localeID)
     if localeID in icu.Collator.getAvailableLocales():
         collator = icu.Collator.createInstance(icu.Locale(localeID))
     else:
         collator = icu.Collator.createInstance(icu.Locale.getRoot())
-    type = EXEMPLAR_TYPES[extype]
-    if localeID not in icu.Locale.getAvailableLocales():
-        raise ValueError(
-            f"Specified Locale {localeID} not available in icu4c {get_icu_version()}"
-        )
     try:
         return sorted(
-            icu.LocaleData(localeID).getExemplarSet(option, type),
+            get_exemplar_set(localeID, extype, option),
             key=collator.getSortKey,
         )
     except icu.ICUError as e:
@@ -92,6 +163,359 @@ def get_exemplars(localeID: str, extype: str = "main", option: int = 0) -> List[
         sys.exit(1)
 
 
+def get_exemplar_set(
+    localeID: str, extype: str = "main", option: int = 0
+) -> icu.UnicodeSet:
+    """
+    Retrieve the exemplar set for a given locale and type.
+
+    The frozen icu.UnicodeSet is cached by (locale, type, option) and must not
+    be modified.  Use the set algebra helpers to combine exemplar sets.
+
+    Parameters:
+    localeID (str): The locale identifier.
+    extype (str): The type of exemplars to retrieve (main, auxiliary, index, punctuation).
+    option (int): The option for exemplar set (see get_exemplars).
+
+    Returns:
+    icu.UnicodeSet: Frozen exemplar set.
+    """
+    option = option if option in OPTIONS else 0
+    extype = extype.lower() if extype.lower() in EXEMPLAR_TYPES else "main"
+    localeID = resolve_locale_id(localeID)
+    return _get_exemplar_set(localeID, EXEMPLAR_TYPES[extype], option)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_exemplar_set(localeID: str, type: int, option: int) -> icu.UnicodeSet:
+    exemplar_set = icu.LocaleData(localeID).getExemplarSet(option, type)
+    exemplar_set.freeze()
+    return exemplar_set
+
+
+@functools.lru_cache(maxsize=None)
+def get_available_locale_ids() -> FrozenSet[str]:
+    """
+    Retrieve the identifiers of the locales available in ICU.
+
+    Returns:
+    FrozenSet[str]: Available locale identifiers.
+    """
+    return frozenset(icu.Locale.getAvailableLocales())
+
+
+def resolve_locale_id(localeID: str) -> str:
+    """
+    Resolve a locale identifier or BCP 47 tag to an available locale ID.
+
+    Tags such as en-Latn-US, zh-TW or pt-br resolve with the resolution table.
+
+    Parameters:
+    localeID (str): The locale identifier.
+
+    Returns:
+    str: Available locale identifier.
+    """
+    normalized = normalize_locale_id(localeID)
+    if normalized in get_available_locale_ids():
+        return normalized
+    resolved = get_locale_resolver().resolve(normalized, fallback=False)
+    if resolved is None:
+        raise ValueError(
+            f"Specified Locale {normalized} not available in icu4c {get_icu_version()}"
+        )
+    return resolved
+
+
+@functools.lru_cache(maxsize=None)
+def get_locale_resolver() -> LocaleResolver:
+    """
+    Retrieve the resolver for the locales available in ICU.
+
+    Returns:
+    LocaleResolver: Resolver backed by the resolution table of the available locales.
+    """
+    localeIDs = get_available_locale_ids()
+    return LocaleResolver(
+        generate_resolution_table(localeIDs), generate_likely_scripts(localeIDs)
+    )
+
+
+def resolve_locale_tag(tag: str, localeIDs: FrozenSet[str]) -> Optional[str]:
+    """
+    Resolve a locale tag to one of the given locale IDs with ICU.
+
+    The tag is canonicalized, then matched as is, maximized with the likely
+    subtags, without the script subtag of the maximized tag when the tag has a
+    region, and minimized.
+
+    Parameters:
+    tag (str): The locale tag.
+    localeIDs (FrozenSet[str]): The available locale IDs.
+
+    Returns:
+    Optional[str]: The matching locale ID, or None if the tag does not match.
+    """
+    locale = icu.Locale.createCanonical(normalize_locale_id(tag))
+    name = locale.getName()
+    if name in localeIDs:
+        return name
+    maximized = icu.Locale(name)
+    maximized.addLikelySubtags()
+    if maximized.getName() in localeIDs:
+        return maximized.getName()
+    if locale.getCountry():
+        candidate = f"{maximized.getLanguage()}_{maximized.getCountry()}"
+        if candidate in localeIDs:
+            return candidate
+    minimized = icu.Locale(name)
+    minimized.minimizeSubtags()
+    if minimized.getName() in localeIDs:
+        return minimized.getName()
+    return None
+
+
+def generate_resolution_table(localeIDs: Iterable[str]) -> Dict[str, str]:
+    """
+    Generate the locale tag resolution table for the given locale IDs.
+
+    The table maps the resolution keys (see resolver.resolution_key) of the
+    locale IDs, of their maximized and minimized forms, of the language-script,
+    language-region and language subtags of the maximized forms, and of legacy
+    language codes, alone and with the script and region subtags of their
+    replacement language, to the locale ID that ICU resolves them to.
+
+    Parameters:
+    localeIDs (Iterable[str]): The available locale IDs.
+
+    Returns:
+    Dict[str, str]: Mapping of resolution keys to available locale IDs.
+    """
+    available = frozenset(localeIDs)
+    candidates = set(LEGACY_LANGUAGE_CODES)
+    for localeID in available:
+        maximized = icu.Locale(localeID)
+        maximized.addLikelySubtags()
+        minimized = icu.Locale(localeID)
+        minimized.minimizeSubtags()
+        language = maximized.getLanguage()
+        candidates.update(
+            [
+                localeID,
+                maximized.getName(),
+                minimized.getName(),
+                language,
+                f"{language}_{maximized.getScript()}",
+                f"{language}_{maximized.getCountry()}",
+            ]
+        )
+    # legacy codes with the script and region subtags of their replacement,
+    # e.g. iw_IL for he_IL, which ICU canonicalizes back to the replacement
+    replacements = {
+        icu.Locale.createCanonical(code).getLanguage(): code
+        for code in LEGACY_LANGUAGE_CODES
+    }
+    for candidate in list(candidates):
+        language, separator, subtags = candidate.partition("_")
+        if separator and language in replacements:
+            candidates.add(f"{replacements[language]}_{subtags}")
+    table = {}
+    for candidate in sorted(candidates):
+        resolved = resolve_locale_tag(candidate, available)
+        if resolved is not None:
+            table[resolution_key(candidate)] = resolved
+    return table
+
+
+def generate_likely_scripts(localeIDs: Iterable[str]) -> Dict[str, str]:
+    """
+    Generate the likely script of the languages of the given locale IDs.
+
+    The resolver only falls back from a language-script tag to the language
+    when the script is the likely script of the language, since ICU does not
+    fall back to a locale of another script, e.g. from ru_Latn to ru.
+
+    Parameters:
+    localeIDs (Iterable[str]): The available locale IDs.
+
+    Returns:
+    Dict[str, str]: Mapping of language subtags to their likely script.
+    """
+    scripts = {}
+    for language in sorted({icu.Locale(localeID).getLanguage() for localeID in localeIDs}):
+        maximized = icu.Locale(language)
+        maximized.addLikelySubtags()
+        if maximized.getScript():
+            scripts[language] = maximized.getScript()
+    return scripts
+
+
+def get_exemplar_pattern(localeID: str, extype: str = "main", option: int = 0) -> str:
+    """
+    Retrieve the exemplar set for a given locale and type as a UnicodeSet pattern.
+
+    Parameters:
+    localeID (str): The locale identifier.
+    extype (str): The type of exemplars to retrieve (main, auxiliary, index, punctuation).
+    option (int): The option for exemplar set (see get_exemplars).
+
+    Returns:
+    str: UnicodeSet pattern of the exemplar set.
+    """
+    try:
+        return get_exemplar_set(localeID, extype, option).toPattern(False)
+    except icu.ICUError as e:
+        # Note: logs and returns an empty set pattern when ICUError encountered
+        sys.stderr.write(f"{e}")
+        return "[]"
+
+
+@functools.lru_cache(maxsize=None)
+def unicode_set_from_pattern(pattern: str) -> icu.UnicodeSet:
+    """
+    Build a frozen UnicodeSet from a serialized UnicodeSet pattern.
+
+    Parameters:
+    pattern (str): The UnicodeSet pattern.
+
+    Returns:
+    icu.UnicodeSet: Frozen UnicodeSet.
+    """
+    unicode_set = icu.UnicodeSet(pattern)
+    unicode_set.freeze()
+    return unicode_set
+
+
+def get_exemplar_set_from_data(
+    data: Dict[str, Any], localeID: str, category: str = "main"
+) -> icu.UnicodeSet:
+    """
+    Rebuild the exemplar set of a locale from the generated JSON data.
+
+    The set is built from the serialized patterns, so ICU locale data is not used.
+
+    Parameters:
+    data (Dict[str, Any]): Dictionary containing locale data.
+    localeID (str): The locale identifier.
+    category (str): The exemplar category (main, auxiliary, punctuation,
+        case_insensitive, case_mapping).
+
+    Returns:
+    icu.UnicodeSet: Frozen exemplar set.
+    """
+    localeID = normalize_locale_id(localeID)
+    try:
+        pattern = data["locales"][localeID]["patterns"][category]
+    except KeyError:
+        raise ValueError(f"No {category} exemplar pattern for locale {localeID}")
+    return unicode_set_from_pattern(pattern)
+
+
+def contains_exemplars(
+    text: str, localeID: str, extype: str = "main", option: int = 0
+) -> bool:
+    """
+    Check whether a string only uses exemplars of a given locale and type.
+
+    Parameters:
+    text (str): The string to check.
+    localeID (str): The locale identifier.
+    extype (str): The type of exemplars (main, auxiliary, index, punctuation).
+    option (int): The option for exemplar set (see get_exemplars).
+
+    Returns:
+    bool: True if all characters of the string are in the exemplar set.
+    """
+    return get_exemplar_set(localeID, extype, option).containsAll(text)
+
+
+def span_exemplars(
+    text: str, localeID: str, extype: str = "main", option: int = 0
+) -> int:
+    """
+    Measure the initial part of a string that only uses exemplars.
+
+    Multi-character exemplar sequences are matched longest first.
+
+    Parameters:
+    text (str): The string to measure.
+    localeID (str): The locale identifier.
+    extype (str): The type of exemplars (main, auxiliary, index, punctuation).
+    option (int): The option for exemplar set (see get_exemplars).
+
+    Returns:
+    int: Length of the exemplar span, as an index into the string.
+    """
+    exemplar_set = get_exemplar_set(localeID, extype, option)
+    units = exemplar_set.span(text, icu.USetSpanCondition.SPAN_SIMPLE)
+    if text.isascii():
+        return units
+    # ICU returns the span length in UTF-16 code units
+    return len(text[:units].encode("utf-16-le")[: units * 2].decode("utf-16-le"))
+
+
+def union_exemplar_sets(exemplar_sets: Iterable[icu.UnicodeSet]) -> icu.UnicodeSet:
+    """
+    Build the union of exemplar sets.
+
+    Parameters:
+    exemplar_sets (Iterable[icu.UnicodeSet]): The exemplar sets to combine.
+
+    Returns:
+    icu.UnicodeSet: Frozen union of the sets.
+    """
+    result = icu.UnicodeSet()
+    for exemplar_set in exemplar_sets:
+        result.addAll(exemplar_set)
+    result.freeze()
+    return result
+
+
+def intersect_exemplar_sets(
+    exemplar_sets: Iterable[icu.UnicodeSet],
+) -> icu.UnicodeSet:
+    """
+    Build the intersection of exemplar sets.
+
+    Parameters:
+    exemplar_sets (Iterable[icu.UnicodeSet]): The exemplar sets to combine.
+
+    Returns:
+    icu.UnicodeSet: Frozen intersection of the sets, empty if no sets are given.
+    """
+    result = None
+    for exemplar_set in exemplar_sets:
+        if result is None:
+            result = icu.UnicodeSet()
+            result.addAll(exemplar_set)
+        else:
+            result.retainAll(exemplar_set)
+    result = result if result is not None else icu.UnicodeSet()
+    result.freeze()
+    return result
+
+
+def difference_exemplar_sets(
+    exemplar_set: icu.UnicodeSet, exemplar_sets: Iterable[icu.UnicodeSet]
+) -> icu.UnicodeSet:
+    """
+    Build the difference between an exemplar set and other exemplar sets.
+
+    Parameters:
+    exemplar_set (icu.UnicodeSet): The exemplar set to subtract from.
+    exemplar_sets (Iterable[icu.UnicodeSet]): The exemplar sets to subtract.
+
+    Returns:
+    icu.UnicodeSet: Frozen set of the exemplars that are not in the other sets.
+    """
+    result = icu.UnicodeSet()
+    result.addAll(exemplar_set)
+    for other in exemplar_sets:
+        result.removeAll(other)
+    result.freeze()
+    return result
+
+
 def get_icu_version() -> str:
     """
     Retrieve the ICU version.
@@ -207,10 +631,83 @@ def categorize_exemplars(exemplars: List[str]) -> Dict[str, Optional[List[str]]]
     }
 
 
-def generate_locale_data() -> Dict[str, Any]:
+def get_locale_script(localeID: str) -> str:
+    """
+    Retrieve the likely script of a given locale.
+
+    Parameters:
+    localeID (str): The locale identifier.
+
+    Returns:
+    str: ISO 15924 script code, or "Zzzz" when the script is unknown.
+    """
+    script = icu.Locale(normalize_locale_id(localeID)).addLikelySubtags().getScript()
+    return script if script else "Zzzz"
+
+
+def get_script_name(script: str) -> str:
+    """
+    Retrieve the Unicode name of a given script.
+
+    Parameters:
+    script (str): ISO 15924 script code.
+
+    Returns:
+    str: Script name, or the script code when ICU does not define the script.
+    """
+    try:
+        return icu.Script(icu.Script.getCode(script)[0]).getName()
+    except (icu.ICUError, IndexError):
+        return script
+
+
+def add_script_aggregate(
+    aggregates: Dict[str, Any], localeID: str, locale_data: Dict[str, Any]
+) -> None:
+    """
+    Add the exemplars of a locale to the aggregate of its likely script.
+
+    Each aggregate counts, by exemplar, the number of locales that include it in
+    their main, auxiliary and punctuation exemplars.
+
+    Parameters:
+    aggregates (Dict[str, Any]): Script aggregates, updated in place.
+    localeID (str): The locale identifier.
+    locale_data (Dict[str, Any]): The locale data generated for the locale.
+    """
+    script = get_locale_script(localeID)
+    if script not in aggregates:
+        aggregates[script] = {
+            "name": get_script_name(script),
+            "locales": [],
+            "main": {},
+            "auxiliary": {},
+            "punctuation": {},
+        }
+    aggregate = aggregates[script]
+    aggregate["locales"].append(localeID)
+    for category in SCRIPT_AGGREGATE_CATEGORIES:
+        exemplars = locale_data[category]
+        if isinstance(exemplars, dict):
+            exemplars = (exemplars["single_chars"] or []) + (
+                exemplars["sequences"] or []
+            )
+        counts = aggregate[category]
+        for exemplar in exemplars or []:
+            counts[exemplar] = counts.get(exemplar, 0) + 1
+
+
+def generate_locale_data(
+    script_aggregates: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Generate locale data for all available locales.
 
+    Parameters:
+    script_aggregates (Optional[Dict[str, Any]]): Dictionary that receives the
+        per-script exemplar aggregates (see add_script_aggregate) in the same
+        pass over the locales.
+
     Returns:
     Dict[str, Any]: Dictionary containing locale data.
     """
@@ -226,8 +723,19 @@ def generate_locale_data() -> Dict[str, Any]:
             "case_mapping": categorize_exemplars(get_exemplars(localeID, "main", 4)),
             "numbers": get_number_symbols(localeID),
             "currency": get_currency(localeID),
+            "patterns": {
+                "main": get_exemplar_pattern(localeID, "main"),
+                "auxiliary": get_exemplar_pattern(localeID, "auxiliary"),
+                "punctuation": get_exemplar_pattern(localeID, "punctuation"),
+                "case_insensitive": get_exemplar_pattern(localeID, "main", 2),
+                "case_mapping": get_exemplar_pattern(localeID, "main", 4),
+            },
         }
         data["display_names"][localeID] = get_locale_name(localeID)
+        if script_aggregates is not None:
+            add_script_aggregate(
+                script_aggregates, localeID, data["locales"][localeID]
+            )
     return data
 
 
@@ -251,43 +759,398 @@ def validate_json_data(data: Dict[str, Any]) -> None:
         sys.exit(1)
 
 
-def write_json_files(data: Dict[str, Any], output_dir: str) -> None:
+def _write_gzip(filepath: Path, payload: bytes, level: int) -> None:
+    with gzip.GzipFile(
+        filename=str(filepath),
+        mode="wb",
+        compresslevel=level,
+        mtime=0,
+    ) as f:
+        f.write(payload)
+
+
+def _write_lzma(filepath: Path, payload: bytes, level: int) -> None:
+    with filepath.open("wb") as f:
+        f.write(lzma.compress(payload, preset=level))
+
+
+def _write_zstd(filepath: Path, payload: bytes, level: int) -> None:
+    with filepath.open("wb") as f:
+        f.write(zstd.compress(payload, level=level))
+
+
+# Compression codecs of the precompressed data-min.json files by name, with the
+# file suffix, the default level, the (min, max) levels, the writer and the
+# decompressor.  Writers must produce deterministic output, e.g. without
+# timestamps.
+COMPRESSION_CODECS: Dict[str, Dict[str, Any]] = {
+    "gzip": {
+        "suffix": ".gz",
+        "level": 9,
+        "levels": (0, 9),
+        "write": _write_gzip,
+        "decompress": gzip.decompress,
+    },
+    "xz": {
+        "suffix": ".xz",
+        "level": 9,
+        "levels": (0, 9),
+        "write": _write_lzma,
+        "decompress": lzma.decompress,
+    },
+}
+if zstd is not None:
+    COMPRESSION_CODECS["zstd"] = {
+        "suffix": ".zst",
+        "level": 19,
+        "levels": zstd.CompressionParameter.compression_level.bounds(),
+        "write": _write_zstd,
+        "decompress": zstd.decompress,
+    }
+
+
+def get_compression_codec(name: str, level: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Retrieve a compression codec by name, checking a compression level.
+
+    Parameters:
+    name (str): The codec name, e.g. gzip.
+    level (Optional[int]): The compression level to check, if any.
+
+    Returns:
+    Dict[str, Any]: The codec entry of COMPRESSION_CODECS.
+    """
+    if name not in COMPRESSION_CODECS:
+        raise ValueError(
+            f"Unknown compression codec {name}, "
+            f"available codecs: {', '.join(COMPRESSION_CODECS)}"
+        )
+    codec = COMPRESSION_CODECS[name]
+    low, high = codec["levels"]
+    if level is not None and not low <= level <= high:
+        raise ValueError(
+            f"Invalid {name} compression level {level}, expected {low} to {high}"
+        )
+    return codec
+
+
+def parse_codecs(spec: str) -> Dict[str, int]:
+    """
+    Parse a comma-separated list of compression codecs with optional levels.
+
+    Parameters:
+    spec (str): The codecs, e.g. "gzip,xz:6".
+
+    Returns:
+    Dict[str, int]: Mapping of codec names to compression levels.
+    """
+    codecs = {}
+    for item in spec.split(","):
+        name, _, level = item.strip().partition(":")
+        codec = get_compression_codec(name, int(level) if level else None)
+        codecs[name] = int(level) if level else codec["level"]
+    return codecs
+
+
+def compress_artifact(
+    payload: bytes, filepath: Path, codec: str, level: int, measure: bool = False
+) -> Dict[str, Any]:
+    """
+    Write a precompressed artifact file with a compression codec.
+
+    Parameters:
+    payload (bytes): The data to compress.
+    filepath (Path): Path of the compressed file.
+    codec (str): The codec name in COMPRESSION_CODECS.
+    level (int): The compression level.
+    measure (bool): Whether to read the file back and measure decompression.
+
+    Returns:
+    Dict[str, Any]: The compression report of the file.
+    """
+    start = time.perf_counter()
+    COMPRESSION_CODECS[codec]["write"](filepath, payload, level)
+    report = {
+        "codec": codec,
+        "level": level,
+        "file": filepath.name,
+        "compress_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    if measure:
+        compressed = filepath.read_bytes()
+        start = time.perf_counter()
+        decompressed = COMPRESSION_CODECS[codec]["decompress"](compressed)
+        report["decompress_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        if decompressed != payload:
+            raise ValueError(f"Compressed file {filepath} does not round-trip")
+        report["bytes"] = len(compressed)
+        report["ratio"] = round(len(payload) / len(compressed), 2)
+    return report
+
+
+def write_json_files(
+    data: Dict[str, Any],
+    output_dir: str,
+    sqlite: bool = False,
+    codecs: Optional[Dict[str, int]] = None,
+    compression_report: bool = False,
+) -> None:
     """
     Write JSON data to files.
 
+    The minified data are compressed with each codec in a thread pool, while the
+    pretty printed data are serialized.  The compressors release the GIL, so
+    the codecs run concurrently with each other and with the serialization.
+
     Parameters:
     data (Dict[str, Any]): JSON data to write.
     output_dir (str): Directory to write the files to.
+    sqlite (bool): Whether to also write the data.sqlite database.
+    codecs (Optional[Dict[str, int]]): Mapping of additional compression codecs
+        to levels of the precompressed data-min.json files.  The DEFAULT_CODECS
+        are always written, and their levels can be changed.
+    compression_report (bool): Whether to write the compression.json report
+        with the ratio and compress/decompress time of each codec.
     """
+    codecs = {**DEFAULT_CODECS, **(codecs or {})}
+    # check the codecs before any file is written
+    suffixes = {
+        codec: get_compression_codec(codec, level)["suffix"]
+        for codec, level in codecs.items()
+    }
     json_dir = Path(output_dir)
     json_dir.mkdir(parents=True, exist_ok=True)
     minified_data = json.dumps(
         data, separators=(",", ":"), ensure_ascii=False, sort_keys=True
     )
-    with (json_dir / "data-pp.json").open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=4, sort_keys=True)
-    with (json_dir / "data.json").open("w", encoding="utf-8") as f:
-        f.write(minified_data)
-    with gzip.GzipFile(
-        filename=str(json_dir / "data-min.json.gz"),
-        mode="wb",
-        compresslevel=9,
-        mtime=0,
-    ) as f:
-        f.write(minified_data.encode("utf-8"))
+    payload = minified_data.encode("utf-8")
+    with ThreadPoolExecutor(max_workers=max(len(codecs), 1)) as executor:
+        futures = [
+            executor.submit(
+                compress_artifact,
+                payload,
+                json_dir / f"data-min.json{suffixes[codec]}",
+                codec,
+                level,
+                compression_report,
+            )
+            for codec, level in codecs.items()
+        ]
+        with (json_dir / "data-pp.json").open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4, sort_keys=True)
+        with (json_dir / "data.json").open("w", encoding="utf-8") as f:
+            f.write(minified_data)
+        reports = [future.result() for future in futures]
+    if compression_report:
+        write_json_artifact(
+            {"bytes": len(payload), "codecs": reports}, output_dir, "compression.json"
+        )
+    if sqlite:
+        write_sqlite_database(data, str(json_dir / "data.sqlite"))
+
+
+def write_sqlite_database(data: Dict[str, Any], filepath: str) -> None:
+    """
+    Write locale data to a SQLite database with normalized tables.
+
+    The exemplars table holds one row per exemplar, by category and by ICU
+    exemplar type and option.  The rank column is the position of the exemplar
+    in the collation-sorted single_chars or sequences list.  The rows are bulk
+    inserted in a single transaction, and the indexes are built afterwards.
+
+    Parameters:
+    data (Dict[str, Any]): JSON data to write.
+    filepath (str): Path of the database file, replaced if it exists.
+    """
+    path = Path(filepath)
+    path.unlink(missing_ok=True)
+    locales = []
+    exemplars = []
+    number_symbols = []
+    digits = []
+    currencies = []
+    for localeID, locale_data in data["locales"].items():
+        locales.append(
+            (
+                localeID,
+                data["display_names"].get(localeID),
+                localeID.split("_", 1)[0],
+            )
+        )
+        for category, (extype, option) in EXEMPLAR_CATEGORIES.items():
+            values = locale_data[category]
+            if isinstance(values, dict):
+                lists = [values["single_chars"], values["sequences"]]
+            else:
+                lists = [values]
+            for values in lists:
+                for rank, exemplar in enumerate(values or []):
+                    is_sequence = len(exemplar) > 1
+                    exemplars.append(
+                        (
+                            localeID,
+                            category,
+                            extype,
+                            option,
+                            exemplar,
+                            None if is_sequence else ord(exemplar),
+                            int(is_sequence),
+                            rank,
+                        )
+                    )
+        for symbol, value in locale_data["numbers"].items():
+            if symbol == "digits":
+                for number, digit in enumerate(value):
+                    digits.append((localeID, number, digit, ord(digit)))
+            else:
+                number_symbols.append((localeID, symbol, value))
+        if locale_data["currency"] is not None:
+            currencies.append((localeID, locale_data["currency"]))
+
+    connection = sqlite3.connect(str(path))
+    try:
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.executescript(SQLITE_SCHEMA)
+        with connection:
+            connection.execute(
+                "INSERT INTO metadata VALUES (?, ?)",
+                ("icu_version", data["icu_version"]),
+            )
+            connection.executemany("INSERT INTO locales VALUES (?, ?, ?)", locales)
+            connection.executemany(
+                "INSERT INTO exemplars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", exemplars
+            )
+            connection.executemany(
+                "INSERT INTO number_symbols VALUES (?, ?, ?)", number_symbols
+            )
+            connection.executemany("INSERT INTO digits VALUES (?, ?, ?, ?)", digits)
+            connection.executemany("INSERT INTO currencies VALUES (?, ?)", currencies)
+        connection.executescript(SQLITE_INDEXES)
+        connection.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def write_json_artifact(data: Dict[str, Any], output_dir: str, filename: str) -> None:
+    """
+    Write minified JSON data to an additional artifact file.
+
+    Parameters:
+    data (Dict[str, Any]): JSON data to write.
+    output_dir (str): Directory to write the file to.
+    filename (str): Name of the file.
+    """
+    json_dir = Path(output_dir)
+    json_dir.mkdir(parents=True, exist_ok=True)
+    with (json_dir / filename).open("w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+
+
+def write_script_aggregates(
+    aggregates: Dict[str, Any], icu_version: str, output_dir: str
+) -> None:
+    """
+    Write the per-script exemplar aggregates to a JSON file.
+
+    Parameters:
+    aggregates (Dict[str, Any]): Script aggregates from generate_locale_data.
+    icu_version (str): ICU version used to generate the aggregates.
+    output_dir (str): Directory to write the file to.
+    """
+    for aggregate in aggregates.values():
+        aggregate["locales"].sort()
+    write_json_artifact(
+        {"icu_version": icu_version, "scripts": aggregates},
+        output_dir,
+        "scripts.json",
+    )
 
 
-def create_json_dump(output_dir: str = "api") -> None:
+def write_resolution_table(
+    table: Dict[str, str],
+    icu_version: str,
+    output_dir: str,
+    scripts: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Write the locale tag resolution table to a JSON file.
+
+    Parameters:
+    table (Dict[str, str]): Resolution table from generate_resolution_table.
+    icu_version (str): ICU version used to generate the table.
+    output_dir (str): Directory to write the file to.
+    scripts (Optional[Dict[str, str]]): Likely scripts from
+        generate_likely_scripts.
+    """
+    write_json_artifact(
+        {"icu_version": icu_version, "locales": table, "scripts": scripts or {}},
+        output_dir,
+        "resolution.json",
+    )
+
+
+def create_json_dump(
+    output_dir: str = "api",
+    sqlite: bool = False,
+    codecs: Optional[Dict[str, int]] = None,
+    compression_report: bool = False,
+) -> None:
     """
     Create a JSON dump of locale data.
 
     Parameters:
     output_dir (str): Directory to write the files to.
+    sqlite (bool): Whether to also write the data.sqlite database.
+    codecs (Optional[Dict[str, int]]): Mapping of additional compression codecs
+        to levels of the precompressed data-min.json files (see
+        write_json_files).
+    compression_report (bool): Whether to write the compression.json report.
     """
-    data = generate_locale_data()
+    script_aggregates: Dict[str, Any] = {}
+    data = generate_locale_data(script_aggregates)
     validate_json_data(data)
-    write_json_files(data, output_dir)
+    write_json_files(data, output_dir, sqlite, codecs, compression_report)
+    write_script_aggregates(script_aggregates, data["icu_version"], output_dir)
+    write_resolution_table(
+        generate_resolution_table(data["locales"]),
+        data["icu_version"],
+        output_dir,
+        generate_likely_scripts(data["locales"]),
+    )
+
+
+def main() -> None:
+    """
+    Generate the JSON data with the options given on the command line.
+    """
+    # abbreviations are rejected, so that misspelled options are not ambiguous
+    parser = argparse.ArgumentParser(
+        description="Generate the locale exemplar JSON data.", allow_abbrev=False
+    )
+    parser.add_argument(
+        "--output-dir", default="api", help="directory to write the files to"
+    )
+    parser.add_argument(
+        "--sqlite", action="store_true", help="also write the data.sqlite database"
+    )
+    parser.add_argument(
+        "--codecs",
+        type=parse_codecs,
+        help="comma-separated additional compression codecs with optional levels "
+        "of the precompressed data-min.json files, e.g. xz:6 or gzip:6,xz; "
+        "data-min.json.gz is always written "
+        f"(available: {', '.join(COMPRESSION_CODECS)})",
+    )
+    parser.add_argument(
+        "--compression-report",
+        action="store_true",
+        help="write the compression.json report",
+    )
+    args = parser.parse_args()
+    create_json_dump(args.output_dir, args.sqlite, args.codecs, args.compression_report)
 
 
 if __name__ == "__main__":
-    create_json_dump()
+    main()
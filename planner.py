@@ -0,0 +1,242 @@
+# Copyright 2025 Google, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Glyph set planner.
+
+Computes the exemplar union needed to support a list of locales, and ranks the
+locales by the number of exemplars that only they require.  The generated
+locale data are loaded once into one bitset per locale and category, where
+each bit is an index into the sorted list of all exemplar strings.
+"""
+
+import argparse
+import functools
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from scanner import (
+    CATEGORIES,
+    DEFAULT_CATEGORIES,
+    get_category_exemplars,
+    load_locale_data,
+)
+
+# Maximum number of memoized plans per planner
+PLAN_CACHE_SIZE: int = 256
+
+
+def _bit_indexes(bits: int) -> List[int]:
+    """
+    List the indexes of the set bits of a bitset, lowest first.
+    """
+    indexes = []
+    binary = bin(bits)[:1:-1]
+    index = binary.find("1")
+    while index != -1:
+        indexes.append(index)
+        index = binary.find("1", index + 1)
+    return indexes
+
+
+class GlyphSetPlanner:
+    """
+    Exemplar union and marginal cost planner for locale lists.
+
+    Parameters:
+    data (Dict[str, Any]): Dictionary containing locale data.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        exemplars = set()
+        for locale_data in data["locales"].values():
+            for category in CATEGORIES:
+                exemplars.update(get_category_exemplars(locale_data, category))
+        # single characters in codepoint order, followed by the sequences
+        self.strings: List[str] = sorted(exemplars, key=lambda s: (len(s) > 1, s))
+        index = {string: i for i, string in enumerate(self.strings)}
+
+        self.bitsets: Dict[str, Dict[str, int]] = {}
+        for localeID, locale_data in data["locales"].items():
+            locale_bitsets = {}
+            for category in CATEGORIES:
+                bits = 0
+                for exemplar in get_category_exemplars(locale_data, category):
+                    bits |= 1 << index[exemplar]
+                locale_bitsets[category] = bits
+            self.bitsets[localeID] = locale_bitsets
+        self._plan = functools.lru_cache(maxsize=PLAN_CACHE_SIZE)(self._compute_plan)
+
+    def locale_bitset(
+        self, localeID: str, categories: Sequence[str] = DEFAULT_CATEGORIES
+    ) -> int:
+        """
+        Retrieve the exemplar bitset of a locale for the given categories.
+
+        Parameters:
+        localeID (str): The locale identifier.
+        categories (Sequence[str]): The exemplar categories.
+
+        Returns:
+        int: Bitset of the exemplar string indexes.
+        """
+        locale_bitsets = self.bitsets.get(localeID.replace("-", "_"))
+        if locale_bitsets is None:
+            raise ValueError(f"Specified Locale {localeID} not available in data")
+        bits = 0
+        for category in categories:
+            if category not in locale_bitsets:
+                raise ValueError(f"Unsupported exemplar category {category}")
+            bits |= locale_bitsets[category]
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """
+        Convert a bitset to the exemplar strings that it contains.
+
+        Parameters:
+        bits (int): Bitset of the exemplar string indexes.
+
+        Returns:
+        List[str]: Single characters in codepoint order, followed by sequences.
+        """
+        return [self.strings[i] for i in _bit_indexes(bits)]
+
+    def plan(
+        self,
+        localeIDs: Iterable[str],
+        categories: Sequence[str] = DEFAULT_CATEGORIES,
+    ) -> Mapping[str, Any]:
+        """
+        Plan the exemplar union for a list of locales.
+
+        Plans are memoized by locale set and categories, and are returned as
+        read-only mappings of tuples.
+
+        Parameters:
+        localeIDs (Iterable[str]): The target locale identifiers.
+        categories (Sequence[str]): The exemplar categories to support.
+
+        Returns:
+        Mapping[str, Any]: Mapping with the sorted "locales", the union
+            "single_chars", "codepoints" and "sequences", and the "marginal"
+            tuple of (locale, count) pairs, highest count first.
+        """
+        localeIDs = tuple(sorted({localeID.replace("-", "_") for localeID in localeIDs}))
+        return self._plan(localeIDs, tuple(categories))
+
+    def _compute_plan(
+        self, localeIDs: Tuple[str, ...], categories: Tuple[str, ...]
+    ) -> Mapping[str, Any]:
+        bitsets = [self.locale_bitset(localeID, categories) for localeID in localeIDs]
+
+        # prefix[i] is the union before locale i, suffix[i] the union after it
+        prefix = [0] * (len(bitsets) + 1)
+        suffix = [0] * (len(bitsets) + 1)
+        for i, bits in enumerate(bitsets):
+            prefix[i + 1] = prefix[i] | bits
+        for i in range(len(bitsets) - 1, -1, -1):
+            suffix[i] = suffix[i + 1] | bitsets[i]
+        marginal = [
+            (localeID, (bits & ~(prefix[i] | suffix[i + 1])).bit_count())
+            for i, (localeID, bits) in enumerate(zip(localeIDs, bitsets))
+        ]
+        marginal.sort(key=lambda item: (-item[1], item[0]))
+
+        union = self.decode(prefix[-1])
+        single_chars = tuple(string for string in union if len(string) == 1)
+        # the plan is shared by the memoized calls, so it is read-only
+        return MappingProxyType(
+            {
+                "locales": localeIDs,
+                "single_chars": single_chars,
+                "codepoints": tuple(ord(char) for char in single_chars),
+                "sequences": tuple(string for string in union if len(string) > 1),
+                "marginal": tuple(marginal),
+            }
+        )
+
+
+def print_plan(plan: Mapping[str, Any], top: int = 20) -> None:
+    """
+    Print the exemplar union and the locales with the highest marginal cost.
+
+    Parameters:
+    plan (Mapping[str, Any]): The plan returned by GlyphSetPlanner.plan.
+    top (int): The number of locales listed in the marginal cost ranking.
+    """
+    print(f"{len(plan['locales'])} locales")
+    print(f"\n--- Codepoints ({len(plan['codepoints'])}) ---")
+    for codepoint in plan["codepoints"]:
+        print(f"U+{codepoint:04X} {chr(codepoint)}")
+    print(f"\n--- Sequences ({len(plan['sequences'])}) ---")
+    for sequence in plan["sequences"]:
+        codepoints = " ".join(f"U+{ord(char):04X}" for char in sequence)
+        print(f"{codepoints} {sequence}")
+    print("\n--- Marginal Cost ---")
+    for localeID, count in plan["marginal"][:top]:
+        print(f"{localeID:<15} {count}")
+
+
+def main() -> None:
+    """
+    Plan the exemplar union for the locales given on the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Compute the exemplar union for a list of locales."
+    )
+    parser.add_argument("locales", nargs="*", help="target locale identifiers")
+    parser.add_argument(
+        "-f",
+        "--locales-file",
+        help="file with whitespace-separated target locale identifiers",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="plan for all locales in the data"
+    )
+    parser.add_argument(
+        "--data",
+        default=str(Path(__file__).resolve().parent / "api" / "data.json"),
+        help="path to data.json or data-min.json.gz",
+    )
+    parser.add_argument(
+        "--categories",
+        default=",".join(DEFAULT_CATEGORIES),
+        help="comma-separated exemplar categories to support",
+    )
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        data = load_locale_data(args.data)
+        localeIDs = list(args.locales)
+        if args.locales_file:
+            with open(args.locales_file, "r", encoding="utf-8") as f:
+                localeIDs += f.read().split()
+        if args.all:
+            localeIDs += list(data["locales"])
+        if not localeIDs:
+            parser.error("no target locales")
+        planner = GlyphSetPlanner(data)
+        plan = planner.plan(localeIDs, args.categories.split(","))
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"{e}\n")
+        sys.exit(1)
+    print_plan(plan, args.top)
+
+
+if __name__ == "__main__":
+    main()
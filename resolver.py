@@ -0,0 +1,157 @@
+# Copyright 2025 Google, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+BCP 47 locale tag resolver.
+
+Resolves user-supplied locale tags to the available locale IDs of the generated
+data with the precomputed resolution table and likely scripts (see
+exemplars.generate_resolution_table and exemplars.generate_likely_scripts).
+Lookups are dictionary lookups on a normalized key and do not use ICU.
+"""
+
+import functools
+import gzip
+import json
+from typing import Dict, Iterable, Optional
+
+# Maximum number of cached tag resolutions per resolver
+RESOLVE_CACHE_SIZE: int = 65536
+
+
+def resolution_key(tag: str) -> str:
+    """
+    Normalize a BCP 47 or ICU locale tag to a resolution table key.
+
+    The key is the lowercase language, script, region and variant subtags joined
+    with '_'.  Extensions, private use subtags, ICU keywords and POSIX
+    codeset suffixes are dropped.
+
+    Parameters:
+    tag (str): The locale tag.
+
+    Returns:
+    str: Resolution table key.
+    """
+    tag = tag.split("@", 1)[0].split(".", 1)[0].replace("-", "_").lower()
+    subtags = []
+    for subtag in tag.split("_"):
+        if len(subtag) == 1:
+            # singleton subtags start the extensions and private use subtags
+            break
+        if subtag:
+            subtags.append(subtag)
+    return "_".join(subtags)
+
+
+def _is_script(subtag: str) -> bool:
+    return len(subtag) == 4 and subtag.isalpha()
+
+
+class LocaleResolver:
+    """
+    Locale tag resolver backed by a precomputed resolution table.
+
+    Parameters:
+    table (Dict[str, str]): Mapping of resolution keys to available locale IDs.
+    scripts (Optional[Dict[str, str]]): Mapping of language subtags to their
+        likely script, used to stop the fallback at script changes.
+    cache_size (int): Maximum number of cached tag resolutions.
+    """
+
+    def __init__(
+        self,
+        table: Dict[str, str],
+        scripts: Optional[Dict[str, str]] = None,
+        cache_size: int = RESOLVE_CACHE_SIZE,
+    ):
+        self.table = table
+        self.scripts = {
+            language.lower(): script.lower()
+            for language, script in (scripts or {}).items()
+        }
+        self.resolve = functools.lru_cache(maxsize=cache_size)(self._resolve)
+
+    @classmethod
+    def from_file(
+        cls, filepath: str, cache_size: int = RESOLVE_CACHE_SIZE
+    ) -> "LocaleResolver":
+        """
+        Load a resolver from a resolution.json file.
+
+        Parameters:
+        filepath (str): The path to the resolution JSON or gzip compressed file.
+        cache_size (int): Maximum number of cached tag resolutions.
+
+        Returns:
+        LocaleResolver: The resolver.
+        """
+        if str(filepath).endswith(".gz"):
+            with gzip.open(filepath, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        else:
+            with open(filepath, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        return cls(data["locales"], data.get("scripts"), cache_size)
+
+    @classmethod
+    def from_locale_ids(
+        cls, localeIDs: Iterable[str], cache_size: int = RESOLVE_CACHE_SIZE
+    ) -> "LocaleResolver":
+        """
+        Build a resolver that only normalizes case and separators.
+
+        Use this resolver when the resolution table is not available, e.g. with
+        the locale IDs of data.json.  Likely subtags are not resolved, and the
+        fallback never removes a script subtag.
+
+        Parameters:
+        localeIDs (Iterable[str]): The available locale IDs.
+        cache_size (int): Maximum number of cached tag resolutions.
+
+        Returns:
+        LocaleResolver: The resolver.
+        """
+        return cls(
+            {resolution_key(localeID): localeID for localeID in localeIDs},
+            cache_size=cache_size,
+        )
+
+    def _resolve(self, tag: str, fallback: bool = True) -> Optional[str]:
+        """
+        Resolve a locale tag to an available locale ID.
+
+        Tags that are not in the table fall back by removing the last subtag,
+        e.g. de-AT-1996 to de-AT and fr-US to fr.  Like the ICU locale data
+        fallback, a script subtag is only removed when it is the likely script
+        of the language, so ru-Latn and az-Arab do not resolve to the ru and az
+        locales of another script.
+
+        Parameters:
+        tag (str): The locale tag.
+        fallback (bool): Whether to fall back when the tag is not in the table.
+
+        Returns:
+        Optional[str]: The available locale ID, or None if the tag does not resolve.
+        """
+        key = resolution_key(tag)
+        while key:
+            localeID = self.table.get(key)
+            if localeID is not None or not fallback:
+                return localeID
+            key, _, subtag = key.rpartition("_")
+            if "_" not in key and _is_script(subtag):
+                if self.scripts.get(key) != subtag:
+                    return None
+        return None
@@ -0,0 +1,496 @@
+# Copyright 2025 Google, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Corpus conformance scanner.
+
+Scans text files and reports, for each target locale, the characters that
+fall outside of the locale exemplar sets in the generated JSON data
+(see exemplars.generate_locale_data).  Files are split into newline-aligned
+byte ranges that are read with bounded buffers and scanned across worker
+processes.
+"""
+
+import argparse
+import codecs
+import gzip
+import json
+import os
+import sys
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Exemplar categories that are allowed in conformant text by default
+DEFAULT_CATEGORIES: Tuple[str, ...] = ("main", "auxiliary", "punctuation", "digits")
+
+# Exemplar categories that can be used to build the membership tables
+CATEGORIES: Tuple[str, ...] = (
+    "main",
+    "auxiliary",
+    "punctuation",
+    "case_insensitive",
+    "case_mapping",
+    "digits",
+)
+
+# Unicode normalization forms supported for exemplars and scanned text
+NORMALIZATION_FORMS: Tuple[str, ...] = ("NFC", "NFD", "NFKC", "NFKD")
+
+# Size of the byte ranges that are distributed to the worker processes
+DEFAULT_RANGE_SIZE: int = 32 * 1024 * 1024
+
+# Size of the bounded read buffer used within a byte range
+DEFAULT_BUFFER_SIZE: int = 1024 * 1024
+
+# Membership tables used by the scan worker processes
+_WORKER_TABLES: Dict[str, Dict[str, Any]] = {}
+_WORKER_NORMALIZATION: Optional[str] = None
+
+
+def load_locale_data(filepath: str) -> Dict[str, Any]:
+    """
+    Load the generated locale data from a JSON or gzip compressed JSON file.
+
+    Parameters:
+    filepath (str): The path to the data.json or data-min.json.gz file.
+
+    Returns:
+    Dict[str, Any]: Dictionary containing locale data.
+    """
+    if str(filepath).endswith(".gz"):
+        with gzip.open(filepath, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def get_category_exemplars(locale_data: Dict[str, Any], category: str) -> List[str]:
+    """
+    Retrieve the exemplar strings of one category from a locale data record.
+
+    Parameters:
+    locale_data (Dict[str, Any]): The locale record from the "locales" object.
+    category (str): The exemplar category (main, auxiliary, punctuation,
+        case_insensitive, case_mapping, digits).
+
+    Returns:
+    List[str]: The single characters and sequences in the category.
+    """
+    if category not in CATEGORIES:
+        raise ValueError(f"Unsupported exemplar category {category}")
+    if category == "digits":
+        return list(locale_data["numbers"]["digits"] or [])
+    if category == "punctuation":
+        return list(locale_data["punctuation"] or [])
+    categorized = locale_data[category]
+    return list(categorized["single_chars"] or []) + list(
+        categorized["sequences"] or []
+    )
+
+
+def build_membership_table(
+    locale_data: Dict[str, Any],
+    categories: Sequence[str] = DEFAULT_CATEGORIES,
+    normalization: Optional[str] = "NFC",
+) -> Dict[str, Any]:
+    """
+    Build the membership table for a single locale.
+
+    Exemplars are normalized to the requested form.  Strings that normalize to a
+    single character are stored in a set for constant time lookups, and longer
+    strings are stored as sequences ordered longest first.
+
+    Parameters:
+    locale_data (Dict[str, Any]): The locale record from the "locales" object.
+    categories (Sequence[str]): The exemplar categories allowed in the text.
+    normalization (Optional[str]): The Unicode normalization form, or None to
+        skip normalization.
+
+    Returns:
+    Dict[str, Any]: Dictionary with "chars" and "sequences" members.
+    """
+    if normalization is not None and normalization not in NORMALIZATION_FORMS:
+        raise ValueError(f"Unsupported normalization form {normalization}")
+    chars = set()
+    sequences = set()
+    for category in categories:
+        for exemplar in get_category_exemplars(locale_data, category):
+            if normalization is not None:
+                exemplar = unicodedata.normalize(normalization, exemplar)
+            if len(exemplar) == 1:
+                chars.add(exemplar)
+            elif exemplar:
+                sequences.add(exemplar)
+    return {
+        "chars": frozenset(chars),
+        "sequences": tuple(sorted(sequences, key=lambda s: (-len(s), s))),
+    }
+
+
+def build_membership_tables(
+    data: Dict[str, Any],
+    localeIDs: Iterable[str],
+    categories: Sequence[str] = DEFAULT_CATEGORIES,
+    normalization: Optional[str] = "NFC",
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the membership tables for the target locales.
+
+    Parameters:
+    data (Dict[str, Any]): Dictionary containing locale data.
+    localeIDs (Iterable[str]): The target locale identifiers.
+    categories (Sequence[str]): The exemplar categories allowed in the text.
+    normalization (Optional[str]): The Unicode normalization form, or None to
+        skip normalization.
+
+    Returns:
+    Dict[str, Dict[str, Any]]: Membership tables by locale identifier.
+    """
+    tables = {}
+    for localeID in localeIDs:
+        localeID = localeID.replace("-", "_")
+        if localeID not in data["locales"]:
+            raise ValueError(f"Specified Locale {localeID} not available in data")
+        tables[localeID] = build_membership_table(
+            data["locales"][localeID], categories, normalization
+        )
+    return tables
+
+
+def count_nonexemplars(
+    text: str,
+    tables: Dict[str, Dict[str, Any]],
+    counts: Dict[str, Counter],
+) -> None:
+    """
+    Count the characters of a text block that are not exemplars of each locale.
+
+    Exemplar sequences are removed from the text before the remaining characters
+    are looked up in the locale membership set.  Whitespace is never reported.
+
+    Parameters:
+    text (str): The normalized text block.
+    tables (Dict[str, Dict[str, Any]]): Membership tables by locale identifier.
+    counts (Dict[str, Counter]): Non-exemplar counts by locale, updated in place.
+    """
+    shared = None
+    for localeID, table in tables.items():
+        segment = text
+        for sequence in table["sequences"]:
+            if sequence in segment:
+                # replace with whitespace so that the removal does not join
+                # the neighboring characters into a new sequence
+                segment = segment.replace(sequence, " ")
+        if segment is text:
+            if shared is None:
+                shared = Counter(text)
+            char_counts = shared
+        else:
+            char_counts = Counter(segment)
+        chars = table["chars"]
+        locale_counts = counts.setdefault(localeID, Counter())
+        for char, count in char_counts.items():
+            if char not in chars and not char.isspace():
+                locale_counts[char] += count
+
+
+def plan_byte_ranges(
+    paths: Iterable[str], range_size: int = DEFAULT_RANGE_SIZE
+) -> List[Tuple[str, int, int]]:
+    """
+    Split files into byte ranges that can be scanned independently.
+
+    Parameters:
+    paths (Iterable[str]): The paths of the files to scan.
+    range_size (int): The approximate size of each byte range.
+
+    Returns:
+    List[Tuple[str, int, int]]: List of (path, start, end) byte ranges.
+    """
+    ranges = []
+    for path in paths:
+        size = os.path.getsize(path)
+        start = 0
+        while start < size:
+            end = min(start + range_size, size)
+            ranges.append((str(path), start, end))
+            start = end
+    return ranges
+
+
+def _find_flush_point(text: str) -> int:
+    """
+    Find the index after the last whitespace character in a text block.
+
+    Normalization and sequence matching never cross whitespace, so the text
+    up to this index can be scanned without the remainder of the block.
+    """
+    return max(text.rfind("\n"), text.rfind(" ")) + 1
+
+
+def scan_byte_range(
+    path: str,
+    start: int,
+    end: int,
+    tables: Dict[str, Dict[str, Any]],
+    normalization: Optional[str] = "NFC",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    encoding: str = "utf-8",
+) -> Tuple[Dict[str, Counter], int]:
+    """
+    Scan the lines of a file that start within a byte range.
+
+    The line that crosses the range start belongs to the previous range, and
+    the line that crosses the range end is read to its end.  The encoding must
+    be ASCII compatible.
+
+    Parameters:
+    path (str): The path of the file to scan.
+    start (int): The first byte of the range.
+    end (int): The byte after the end of the range.
+    tables (Dict[str, Dict[str, Any]]): Membership tables by locale identifier.
+    normalization (Optional[str]): The Unicode normalization form, or None to
+        skip normalization.
+    buffer_size (int): The maximum number of bytes read at a time.
+    encoding (str): The text encoding of the file.
+
+    Returns:
+    Tuple[Dict[str, Counter], int]: Non-exemplar counts by locale and the
+        number of bytes scanned.
+    """
+    counts: Dict[str, Counter] = {localeID: Counter() for localeID in tables}
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    carry = ""
+    scanned = 0
+
+    def scan(block: bytes, final: bool = False) -> None:
+        nonlocal carry
+        text = carry + decoder.decode(block, final)
+        flush = len(text) if final else _find_flush_point(text)
+        if not final and flush == 0 and len(text) > buffer_size:
+            # no whitespace in a full buffer, scan it to keep memory bounded
+            flush = len(text)
+        carry = text[flush:]
+        if flush:
+            text = text[:flush]
+            if normalization is not None:
+                text = unicodedata.normalize(normalization, text)
+            count_nonexemplars(text, tables, counts)
+
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                # the partial first line belongs to the previous range, skip it
+                # with bounded reads up to the end of the range
+                while f.tell() < end:
+                    skipped = f.readline(buffer_size)
+                    if not skipped or skipped.endswith(b"\n"):
+                        break
+        position = f.tell()
+        block = b""
+        while position < end:
+            block = f.read(min(buffer_size, end - position))
+            if not block:
+                break
+            position += len(block)
+            scanned += len(block)
+            scan(block)
+        if block and not block.endswith(b"\n"):
+            while True:
+                tail = f.readline(buffer_size)
+                scanned += len(tail)
+                scan(tail)
+                if not tail or tail.endswith(b"\n"):
+                    break
+        scan(b"", final=True)
+    return counts, scanned
+
+
+def _init_worker(tables: Dict[str, Dict[str, Any]], normalization: Optional[str]):
+    """
+    Store the membership tables in a worker process.
+    """
+    global _WORKER_TABLES, _WORKER_NORMALIZATION
+    _WORKER_TABLES = tables
+    _WORKER_NORMALIZATION = normalization
+
+
+def _scan_worker(
+    work: Tuple[str, int, int, int, str],
+) -> Tuple[Dict[str, Counter], int]:
+    """
+    Scan a byte range with the membership tables of the worker process.
+    """
+    path, start, end, buffer_size, encoding = work
+    return scan_byte_range(
+        path,
+        start,
+        end,
+        _WORKER_TABLES,
+        _WORKER_NORMALIZATION,
+        buffer_size,
+        encoding,
+    )
+
+
+def scan_files(
+    paths: Iterable[str],
+    data: Dict[str, Any],
+    localeIDs: Iterable[str],
+    categories: Sequence[str] = DEFAULT_CATEGORIES,
+    normalization: Optional[str] = "NFC",
+    processes: Optional[int] = None,
+    range_size: int = DEFAULT_RANGE_SIZE,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    encoding: str = "utf-8",
+) -> Dict[str, Any]:
+    """
+    Scan text files for characters outside of the target locale exemplar sets.
+
+    Parameters:
+    paths (Iterable[str]): The paths of the files to scan.
+    data (Dict[str, Any]): Dictionary containing locale data.
+    localeIDs (Iterable[str]): The target locale identifiers.
+    categories (Sequence[str]): The exemplar categories allowed in the text.
+    normalization (Optional[str]): The Unicode normalization form, or None to
+        skip normalization.
+    processes (Optional[int]): The number of worker processes.  Defaults to the
+        number of CPUs, and 1 scans in the current process.
+    range_size (int): The approximate size of the byte range per work unit.
+    buffer_size (int): The maximum number of bytes read at a time.
+    encoding (str): The text encoding of the files.
+
+    Returns:
+    Dict[str, Any]: Dictionary with the non-exemplar counts by locale, the number
+        of files and bytes scanned, the elapsed seconds, and the throughput in MB/s.
+    """
+    start_time = time.perf_counter()
+    paths = [str(path) for path in paths]
+    tables = build_membership_tables(data, localeIDs, categories, normalization)
+    work = [
+        (path, start, end, buffer_size, encoding)
+        for path, start, end in plan_byte_ranges(paths, range_size)
+    ]
+    processes = processes or os.cpu_count() or 1
+    processes = min(processes, len(work)) or 1
+
+    counts: Dict[str, Counter] = {localeID: Counter() for localeID in tables}
+    scanned = 0
+    if processes == 1:
+        _init_worker(tables, normalization)
+        results = [_scan_worker(unit) for unit in work]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(tables, normalization),
+        ) as executor:
+            results = list(executor.map(_scan_worker, work))
+    for range_counts, range_scanned in results:
+        scanned += range_scanned
+        for localeID, locale_counts in range_counts.items():
+            counts[localeID].update(locale_counts)
+
+    seconds = time.perf_counter() - start_time
+    return {
+        "locales": {
+            localeID: dict(locale_counts.most_common())
+            for localeID, locale_counts in counts.items()
+        },
+        "files": len(paths),
+        "bytes": scanned,
+        "seconds": seconds,
+        "throughput_mb_s": scanned / 1_000_000 / seconds if seconds else 0.0,
+    }
+
+
+def print_scan_report(report: Dict[str, Any], limit: Optional[int] = None) -> None:
+    """
+    Print the non-exemplar characters by locale with their counts.
+
+    Parameters:
+    report (Dict[str, Any]): The report returned by scan_files.
+    limit (Optional[int]): The maximum number of characters printed per locale.
+    """
+    for localeID, locale_counts in report["locales"].items():
+        total = sum(locale_counts.values())
+        print(f"{localeID}: {len(locale_counts)} characters, {total} occurrences")
+        for char, count in list(locale_counts.items())[:limit]:
+            print(f"  U+{ord(char):04X} {char!r:<8} {count}")
+    print(
+        f"Scanned {report['files']} files, {report['bytes']} bytes in "
+        f"{report['seconds']:.2f}s ({report['throughput_mb_s']:.1f} MB/s)"
+    )
+
+
+def main() -> None:
+    """
+    Scan the files given on the command line and print the report.
+    """
+    parser = argparse.ArgumentParser(
+        description="Report characters outside of locale exemplar sets."
+    )
+    parser.add_argument("paths", nargs="+", help="text files to scan")
+    parser.add_argument(
+        "-l",
+        "--locale",
+        action="append",
+        required=True,
+        help="target locale identifier (repeatable)",
+    )
+    parser.add_argument(
+        "--data",
+        default=str(Path(__file__).resolve().parent / "api" / "data.json"),
+        help="path to data.json or data-min.json.gz",
+    )
+    parser.add_argument(
+        "--categories",
+        default=",".join(DEFAULT_CATEGORIES),
+        help="comma-separated exemplar categories allowed in the text",
+    )
+    parser.add_argument(
+        "--normalization",
+        default="NFC",
+        choices=NORMALIZATION_FORMS + ("none",),
+        help="Unicode normalization form",
+    )
+    parser.add_argument("-j", "--processes", type=int, default=None)
+    parser.add_argument("--encoding", default="utf-8")
+    parser.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args()
+
+    try:
+        data = load_locale_data(args.data)
+        report = scan_files(
+            args.paths,
+            data,
+            args.locale,
+            categories=args.categories.split(","),
+            normalization=None if args.normalization == "none" else args.normalization,
+            processes=args.processes,
+            encoding=args.encoding,
+        )
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"{e}\n")
+        sys.exit(1)
+    print_scan_report(report, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+# Copyright 2025 Google, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Longest-match exemplar segmenter.
+
+Segments text into exemplar units, the single characters and multi-character
+sequences of a locale, and flags the spans that are not exemplars.  The
+exemplars of a locale are built into a trie that is compiled to a regular
+expression, so that the longest-match descent at each position runs in the
+re engine and the scan is linear in the text length.
+"""
+
+import functools
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from scanner import DEFAULT_CATEGORIES, get_category_exemplars
+
+# Characters that are neither exemplars nor flagged by default
+DEFAULT_IGNORE: str = " \t\n\r\f\v   "
+
+# Maximum number of compiled matchers that are cached
+MATCHER_CACHE_SIZE: int = 256
+
+# Trie node key that marks the end of an exemplar
+_END = ""
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    return "[" + "".join(re.escape(char) for char in sorted(chars)) + "]"
+
+
+def _trie_pattern(node: Dict[str, Any]) -> str:
+    """
+    Compile a trie node to a regular expression that matches the longest path.
+
+    Children that end an exemplar and have no children of their own are merged
+    into a character class.  The alternatives start with distinct characters, so
+    at most one of them applies at any position.
+    """
+    branches = []
+    leaves = []
+    for char, child in sorted(node.items()):
+        if char == _END:
+            continue
+        if list(child) == [_END]:
+            leaves.append(char)
+            continue
+        tail = _trie_pattern(child)
+        optional = "?" if _END in child else ""
+        branches.append(f"{re.escape(char)}(?:{tail}){optional}")
+    if leaves:
+        branches.append(_char_class(leaves))
+    return "|".join(branches)
+
+
+class ExemplarMatcher:
+    """
+    Compiled longest-match matcher for a set of exemplars.
+
+    The text must use the same normalization form as the exemplars.
+
+    Parameters:
+    exemplars (Iterable[str]): The single characters and sequences.
+    ignore (str): Characters that are neither exemplar units nor flagged.
+    """
+
+    def __init__(self, exemplars: Iterable[str], ignore: str = DEFAULT_IGNORE):
+        trie: Dict[str, Any] = {}
+        for exemplar in exemplars:
+            if not exemplar:
+                continue
+            node = trie
+            for char in exemplar:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+        ignore = "".join(sorted(set(ignore)))
+        unit = _trie_pattern(trie) or "(?!)"
+        # characters that cannot start an exemplar unit or an ignored run
+        starts = _char_class(set(trie) | set(ignore)) if trie or ignore else ""
+        other = f"[^{starts[1:-1]}]+" if starts else ".+"
+        ignored = _char_class(ignore) if ignore else "(?!)"
+
+        self.max_length = self._max_depth(trie)
+        self._unit = re.compile(unit, re.DOTALL)
+        # one quantifier over single units and ignored characters, only used
+        # with match and finditer, so that a run ends at the first non-exemplar
+        # like segment does, without backtracking into shorter units
+        self._run = re.compile(f"(?:{unit}|{ignored})+", re.DOTALL)
+        self._token = re.compile(
+            f"(?P<unit>{unit})|(?P<ignore>{ignored}+)|(?P<other>{other}|.)", re.DOTALL
+        )
+
+    @staticmethod
+    def _max_depth(node: Dict[str, Any]) -> int:
+        children = [child for char, child in node.items() if char != _END]
+        return 1 + max(map(ExemplarMatcher._max_depth, children)) if children else 0
+
+    def match(self, text: str, pos: int = 0) -> int:
+        """
+        Find the longest exemplar unit at a position.
+
+        Parameters:
+        text (str): The text.
+        pos (int): The position in the text.
+
+        Returns:
+        int: The end of the longest unit, or pos if no unit starts at pos.
+        """
+        found = self._unit.match(text, pos)
+        return found.end() if found else pos
+
+    def is_exemplar_text(self, text: str) -> bool:
+        """
+        Check whether a text only consists of exemplar units and ignored characters.
+
+        Parameters:
+        text (str): The text.
+
+        Returns:
+        bool: True if the text has no non-exemplar spans.
+        """
+        if not text:
+            return True
+        run = self._run.match(text)
+        return run is not None and run.end() == len(text)
+
+    def find_nonexemplars(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Find the maximal spans of the text that are not exemplar units.
+
+        Parameters:
+        text (str): The text.
+
+        Returns:
+        List[Tuple[int, int]]: List of (start, end) spans.
+        """
+        spans = []
+        pos = 0
+        for run in self._run.finditer(text):
+            if run.start() > pos:
+                spans.append((pos, run.start()))
+            pos = run.end()
+        if pos < len(text):
+            spans.append((pos, len(text)))
+        return spans
+
+    def segment(self, text: str) -> List[Tuple[int, int, bool]]:
+        """
+        Segment a text into exemplar units and non-exemplar spans.
+
+        Each exemplar unit is a longest match at its position.  Consecutive
+        non-exemplar characters form a single span, and ignored characters are
+        not part of any segment.
+
+        Parameters:
+        text (str): The text.
+
+        Returns:
+        List[Tuple[int, int, bool]]: List of (start, end, is_exemplar) segments.
+        """
+        segments: List[Tuple[int, int, bool]] = []
+        for token in self._token.finditer(text):
+            kind = token.lastgroup
+            if kind == "unit":
+                segments.append((token.start(), token.end(), True))
+            elif kind == "other":
+                if segments and not segments[-1][2] and segments[-1][1] == token.start():
+                    segments[-1] = (segments[-1][0], token.end(), False)
+                else:
+                    segments.append((token.start(), token.end(), False))
+        return segments
+
+
+@functools.lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _compile_matcher(exemplars: Tuple[str, ...], ignore: str) -> ExemplarMatcher:
+    return ExemplarMatcher(exemplars, ignore)
+
+
+class LocaleMatchers:
+    """
+    Per-locale matchers of a locale dataset.
+
+    Lookups are memoized by locale, categories, normalization and ignored
+    characters, and the compiled matchers are shared between locales with the
+    same exemplars.
+
+    Parameters:
+    data (Dict[str, Any]): Dictionary containing locale data.
+    cache_size (int): Maximum number of memoized lookups.
+    """
+
+    def __init__(self, data: Dict[str, Any], cache_size: int = MATCHER_CACHE_SIZE):
+        self.data = data
+        self._lookup = functools.lru_cache(maxsize=cache_size)(self._build)
+
+    def get_matcher(
+        self,
+        localeID: str,
+        categories: Sequence[str] = DEFAULT_CATEGORIES,
+        normalization: Optional[str] = "NFC",
+        ignore: str = DEFAULT_IGNORE,
+    ) -> ExemplarMatcher:
+        """
+        Retrieve the compiled matcher of a locale.
+
+        Parameters:
+        localeID (str): The locale identifier.
+        categories (Sequence[str]): The exemplar categories of the units.
+        normalization (Optional[str]): The Unicode normalization form of the
+            exemplars, or None to skip normalization.
+        ignore (str): Characters that are neither exemplar units nor flagged.
+
+        Returns:
+        ExemplarMatcher: The compiled matcher.
+        """
+        return self._lookup(
+            localeID.replace("-", "_"), tuple(categories), normalization, ignore
+        )
+
+    def _build(
+        self,
+        localeID: str,
+        categories: Tuple[str, ...],
+        normalization: Optional[str],
+        ignore: str,
+    ) -> ExemplarMatcher:
+        if localeID not in self.data["locales"]:
+            raise ValueError(f"Specified Locale {localeID} not available in data")
+        exemplars = set()
+        for category in categories:
+            locale_data = self.data["locales"][localeID]
+            for exemplar in get_category_exemplars(locale_data, category):
+                if normalization is not None:
+                    exemplar = unicodedata.normalize(normalization, exemplar)
+                exemplars.add(exemplar)
+        return _compile_matcher(tuple(sorted(exemplars)), ignore)
+
+
+# Matchers of the most recently used dataset, see get_matcher
+_LOCALE_MATCHERS: Optional[LocaleMatchers] = None
+
+
+def get_matcher(
+    data: Dict[str, Any],
+    localeID: str,
+    categories: Sequence[str] = DEFAULT_CATEGORIES,
+    normalization: Optional[str] = "NFC",
+    ignore: str = DEFAULT_IGNORE,
+) -> ExemplarMatcher:
+    """
+    Retrieve the compiled matcher of a locale.
+
+    Lookups are memoized for the most recently used dataset, and rebuilt when
+    a different data object is passed.  Use LocaleMatchers to keep the
+    matchers of several datasets.
+
+    Parameters:
+    data (Dict[str, Any]): Dictionary containing locale data.
+    localeID (str): The locale identifier.
+    categories (Sequence[str]): The exemplar categories of the units.
+    normalization (Optional[str]): The Unicode normalization form of the
+        exemplars, or None to skip normalization.
+    ignore (str): Characters that are neither exemplar units nor flagged.
+
+    Returns:
+    ExemplarMatcher: The compiled matcher.
+    """
+    global _LOCALE_MATCHERS
+    matchers = _LOCALE_MATCHERS
+    if matchers is None or matchers.data is not data:
+        matchers = _LOCALE_MATCHERS = LocaleMatchers(data)
+    return matchers.get_matcher(localeID, categories, normalization, ignore)
@@ -0,0 +1,217 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import client
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Stand-in for the published endpoint with ETag and Last-Modified validators.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        server.ports.add(self.client_address[1])
+        if self.path != "/api/data-min.json.gz":
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if server.status is not None:
+            self.send_response(server.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.send_header("ETag", server.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/gzip")
+        self.send_header("Content-Length", str(len(server.body)))
+        self.send_header("ETag", server.etag)
+        self.send_header("Last-Modified", "Mon, 01 Sep 2025 00:00:00 GMT")
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def publish(server, data, etag):
+    """
+    Set the data served by the stand-in server.
+    """
+    server.body = gzip.compress(json.dumps(data).encode("utf-8"), mtime=0)
+    server.etag = etag
+
+
+@pytest.fixture
+def locale_data():
+    """
+    Fixture providing minimal locale data.
+    """
+    return {
+        "icu_version": "67.1",
+        "locales": {
+            "pt_BR": {
+                "main": {"single_chars": ["a", "á"], "sequences": None},
+                "auxiliary": {"single_chars": ["w"], "sequences": None},
+                "punctuation": ["!", "?"],
+                "case_insensitive": {"single_chars": ["a", "A"], "sequences": None},
+                "case_mapping": {"single_chars": ["a", "A"], "sequences": None},
+                "numbers": {"digits": ["0", "1"]},
+                "currency": "R$",
+            }
+        },
+        "display_names": {"pt_BR": "Portuguese (Brazil)"},
+    }
+
+
+@pytest.fixture
+def server(locale_data):
+    """
+    Fixture providing a stand-in HTTP server on a local port.
+    """
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.requests = []
+    httpd.ports = set()
+    httpd.status = None
+    publish(httpd, locale_data, '"v1"')
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/api/data-min.json.gz"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_fetch_and_revalidate(server, tmp_path, locale_data):
+    """
+    Test that a cached response is revalidated and reused on 304 Not Modified.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path), max_age=0) as api:
+        data = api.fetch()
+        assert data == locale_data
+        assert "If-None-Match" not in server.requests[0]
+        assert api.fetch() is data
+        assert server.requests[1]["If-None-Match"] == '"v1"'
+        assert server.requests[1]["If-Modified-Since"].startswith("Mon, 01 Sep")
+    # the connection is reused across requests
+    assert len(server.ports) == 1
+
+
+def test_fetch_changed_content(server, tmp_path, locale_data):
+    """
+    Test that changed content replaces the cached data.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path), max_age=0) as api:
+        api.fetch()
+        locale_data["display_names"]["pt_BR"] = "Português (Brasil)"
+        publish(server, locale_data, '"v2"')
+        assert api.get_display_name("pt-br") == "Português (Brasil)"
+    meta = json.loads(next(tmp_path.glob("*.meta.json")).read_text())
+    assert meta["etag"] == '"v2"'
+
+
+def test_fetch_disk_cache(server, tmp_path, locale_data):
+    """
+    Test that a new client revalidates the disk cache of a previous client.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        api.fetch()
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        assert api.fetch() == locale_data
+    assert server.requests[-1]["If-None-Match"] == '"v1"'
+
+
+def test_fetch_max_age(server, tmp_path):
+    """
+    Test that lookups within max_age do not send requests.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path), max_age=60) as api:
+        api.fetch()
+        api.get_exemplars("pt_BR")
+        api.get_currency("pt_BR")
+        assert len(server.requests) == 1
+        api.fetch(force=True)
+        assert len(server.requests) == 2
+
+
+def test_fetch_offline(server, tmp_path, locale_data):
+    """
+    Test that the disk cache is used when the endpoint cannot be reached.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        api.fetch()
+    server.shutdown()
+    server.server_close()
+    with client.ExemplarClient(server.url, str(tmp_path), timeout=2) as api:
+        assert api.fetch() == locale_data
+
+
+def test_fetch_server_error(server, tmp_path, locale_data):
+    """
+    Test that the disk cache is used when the endpoint responds 503.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        api.fetch()
+    server.status = 503
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        assert api.fetch() == locale_data
+        assert api.get_currency("pt-BR") == "R$"
+    assert len(server.requests) == 2
+    with client.ExemplarClient(server.url, str(tmp_path / "empty")) as api:
+        with pytest.raises(OSError):
+            api.fetch()
+
+
+def test_fetch_errors(server, tmp_path):
+    """
+    Test the fetch function without a disk cache when the request fails.
+    """
+    missing = server.url.replace("data-min", "missing")
+    with client.ExemplarClient(missing, str(tmp_path)) as api:
+        with pytest.raises(OSError):
+            api.fetch()
+    with pytest.raises(ValueError):
+        client.ExemplarClient("ftp://example.com/data-min.json.gz")
+
+
+def test_lookups(server, tmp_path):
+    """
+    Test the lookups of the locsets example.
+    """
+    with client.ExemplarClient(server.url, str(tmp_path)) as api:
+        assert api.resolve_locale_id("PT-br") == "pt_BR"
+        assert api.get_exemplars("pt-BR") == ["a", "á"]
+        assert api.get_exemplars("pt-BR", "auxiliary") == ["w"]
+        assert api.get_exemplars("pt-BR", "case_mapping") == ["a", "A"]
+        assert api.get_digits("pt-BR") == ["0", "1"]
+        assert api.get_punctuation("pt-BR") == ["!", "?"]
+        assert api.get_currency("pt-BR") == "R$"
+        assert api.get_display_name("pt-BR") == "Portuguese (Brazil)"
+        assert api.get_locale_data("xx") == {}
+        assert api.get_exemplars("xx") == []
+        assert api.get_display_name("xx") == "Unknown Locale"
+
+
+def test_get_client(server, tmp_path, monkeypatch):
+    """
+    Test that get_client shares one client per URL.
+    """
+    # the shared clients do not outlive the stand-in server of this test
+    monkeypatch.setattr(client, "_CLIENTS", {})
+    api = client.get_client(server.url, cache_dir=str(tmp_path))
+    assert client.get_client(server.url) is api
+    api.close()
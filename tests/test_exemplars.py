@@ -1,5 +1,6 @@
 import pytest
 import json
+import sqlite3
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -174,6 +175,161 @@ def test_get_exemplars_invalid_option():
     assert all(isinstance(char, str) for char in ex)
 
 
+def test_get_exemplar_set():
+    """
+    Test the get_exemplar_set function returns a cached frozen set.
+    """
+    exemplar_set = exemplars.get_exemplar_set("en", "main")
+    assert isinstance(exemplar_set, exemplars.icu.UnicodeSet)
+    assert exemplar_set.isFrozen()
+    assert exemplar_set is exemplars.get_exemplar_set("en", "invalid-type", 999)
+    assert sorted(exemplar_set) == sorted(exemplars.get_exemplars("en", "main"))
+
+
+def test_get_exemplar_set_invalid_locale():
+    """
+    Test the get_exemplar_set function with an invalid locale.
+    """
+    with pytest.raises(ValueError):
+        exemplars.get_exemplar_set("invalid-locale", "main")
+
+
+def test_contains_exemplars():
+    """
+    Test the contains_exemplars function with exemplar and non-exemplar strings.
+    """
+    assert exemplars.contains_exemplars("chata", "sk")
+    assert not exemplars.contains_exemplars("château", "sk")
+    assert exemplars.contains_exemplars("château", "fr")
+
+
+def test_span_exemplars():
+    """
+    Test the span_exemplars function with sequences and supplementary characters.
+    """
+    assert exemplars.span_exemplars("chata château", "sk") == 5
+    assert exemplars.span_exemplars("", "sk") == 0
+    text = "\U0001E922\U0001E923 x"
+    assert exemplars.span_exemplars(text, "ff_Adlm") == 2
+
+
+def test_exemplar_set_algebra():
+    """
+    Test the union, intersection and difference of exemplar sets.
+    """
+    en = exemplars.get_exemplar_set("en")
+    fr = exemplars.get_exemplar_set("fr")
+    union = exemplars.union_exemplar_sets([en, fr])
+    intersection = exemplars.intersect_exemplar_sets([en, fr])
+    difference = exemplars.difference_exemplar_sets(fr, [en])
+    assert union.isFrozen() and intersection.isFrozen() and difference.isFrozen()
+    assert union.containsAll("abcéœ")
+    assert intersection.containsAll("abc") and not intersection.contains("é")
+    assert difference.contains("é") and not difference.contains("a")
+    assert not en.contains("é")
+    assert exemplars.intersect_exemplar_sets([]).isEmpty()
+
+
+def test_get_exemplar_set_from_data():
+    """
+    Test that exemplar sets rebuilt from patterns match the ICU exemplar sets.
+    """
+    data = {
+        "locales": {
+            "sk": {"patterns": {"main": exemplars.get_exemplar_pattern("sk", "main")}}
+        }
+    }
+    exemplar_set = exemplars.get_exemplar_set_from_data(data, "sk", "main")
+    assert exemplar_set.isFrozen()
+    assert exemplar_set == exemplars.get_exemplar_set("sk", "main")
+    assert "ch" in list(exemplar_set)
+    with pytest.raises(ValueError):
+        exemplars.get_exemplar_set_from_data(data, "sk", "auxiliary")
+
+
+def test_get_exemplars_bcp47_tag():
+    """
+    Test the get_exemplars function with BCP 47 tags that are not locale IDs.
+    """
+    assert exemplars.get_exemplars("en-Latn-US") == exemplars.get_exemplars("en_US")
+    assert exemplars.get_exemplars("pt-br") == exemplars.get_exemplars("pt_BR")
+
+
+def test_resolve_locale_id():
+    """
+    Test the resolve_locale_id function with various locale tags.
+    """
+    assert exemplars.resolve_locale_id("fr-CA") == "fr_CA"
+    assert exemplars.resolve_locale_id("en-Latn-US") == "en_US"
+    assert exemplars.resolve_locale_id("zh-TW") == "zh_Hant_TW"
+    assert exemplars.resolve_locale_id("sr-Cyrl") == "sr_Cyrl"
+    assert exemplars.resolve_locale_id("iw") == "he"
+    with pytest.raises(ValueError):
+        exemplars.resolve_locale_id("fr-US")
+
+
+def test_generate_resolution_table():
+    """
+    Test the generate_resolution_table function maps keys to available locales.
+    """
+    available = exemplars.get_available_locale_ids()
+    table = exemplars.generate_resolution_table(available)
+    assert set(table.values()) <= available
+    assert all(table[localeID.lower()] == localeID for localeID in available)
+    assert table["en_latn_us"] == "en_US"
+    assert table["sr_rs"] == "sr_Cyrl_RS"
+    assert table["sh"] == "sr_Latn"
+    assert table["iw_il"] == "he_IL"
+    assert table["tl_ph"] == "fil_PH"
+    assert table["sh_rs"] == "sr_Latn_RS"
+
+
+def test_get_exemplars_legacy_code_region():
+    """
+    Test the get_exemplars function with legacy language codes and a region.
+    """
+    assert exemplars.get_exemplars("iw-IL") == exemplars.get_exemplars("he_IL")
+    assert exemplars.get_exemplars("tl-PH") == exemplars.get_exemplars("fil_PH")
+    locale_resolver = exemplars.get_locale_resolver()
+    assert locale_resolver.resolve("iw-IL-u-ca-hebrew") == "he_IL"
+    assert locale_resolver.resolve("in-ID") == "id_ID"
+
+
+def test_generate_likely_scripts():
+    """
+    Test the generate_likely_scripts function maps languages to their script.
+    """
+    scripts = exemplars.generate_likely_scripts(["ru_RU", "az_Cyrl", "zh_Hant_TW"])
+    assert scripts == {"az": "Latn", "ru": "Cyrl", "zh": "Hans"}
+
+
+def test_get_locale_resolver_script_fallback():
+    """
+    Test that the resolver does not fall back to a locale of another script.
+    """
+    locale_resolver = exemplars.get_locale_resolver()
+    assert locale_resolver.resolve("ru-Latn") is None
+    assert locale_resolver.resolve("az-Arab") is None
+    assert locale_resolver.resolve("zh-Hant-SG") == "zh_Hant"
+    assert locale_resolver.resolve("ru-Cyrl-XX") == "ru"
+
+
+def test_write_resolution_table(tmp_path):
+    """
+    Test the write_resolution_table function writes the table.
+    """
+    exemplars.write_resolution_table(
+        {"pt_br": "pt_BR"}, "67.1", str(tmp_path), {"pt": "Latn"}
+    )
+    with (tmp_path / "resolution.json").open("r", encoding="utf-8") as f:
+        written = json.load(f)
+    assert written == {
+        "icu_version": "67.1",
+        "locales": {"pt_br": "pt_BR"},
+        "scripts": {"pt": "Latn"},
+    }
+
+
 def test_get_icu_version():
     """
     Test the get_icu_version function.
@@ -310,7 +466,8 @@ def test_generate_locale_data():
     """
     Test the generate_locale_data function.
     """
-    data = exemplars.generate_locale_data()
+    script_aggregates = {}
+    data = exemplars.generate_locale_data(script_aggregates)
 
     # Check that the ICU version is included
     assert "icu_version" in data
@@ -332,11 +489,69 @@ def test_generate_locale_data():
     assert "case_mapping" in en_us_data
     assert "numbers" in en_us_data
     assert "currency" in en_us_data
+    assert "patterns" in en_us_data
 
     # Spot check that display names are correct
     assert data["display_names"]["en_US"] == "English (United States)"
     assert data["display_names"]["fr_FR"] == "French (France)"
 
+    # Check that every locale is aggregated once, in the same pass
+    assert sum(len(a["locales"]) for a in script_aggregates.values()) == len(
+        data["locales"]
+    )
+    assert "en_US" in script_aggregates["Latn"]["locales"]
+    assert "ru" in script_aggregates["Cyrl"]["locales"]
+    assert script_aggregates["Latn"]["main"]["a"] > 100
+
+
+def test_get_locale_script():
+    """
+    Test the get_locale_script function with various locale IDs.
+    """
+    assert exemplars.get_locale_script("en") == "Latn"
+    assert exemplars.get_locale_script("sr") == "Cyrl"
+    assert exemplars.get_locale_script("sr-Latn") == "Latn"
+    assert exemplars.get_locale_script("zh_TW") == "Hant"
+
+
+def test_get_script_name():
+    """
+    Test the get_script_name function with known and unknown scripts.
+    """
+    assert exemplars.get_script_name("Cyrl") == "Cyrillic"
+    assert exemplars.get_script_name("Qqqq") == "Qqqq"
+
+
+def test_add_script_aggregate(valid_data):
+    """
+    Test the add_script_aggregate function counts exemplars by locale.
+    """
+    aggregates = {}
+    locale_data = valid_data["locales"]["en_US"]
+    exemplars.add_script_aggregate(aggregates, "en_US", locale_data)
+    exemplars.add_script_aggregate(aggregates, "en_GB", locale_data)
+    latin = aggregates["Latn"]
+    assert latin["name"] == "Latin"
+    assert latin["locales"] == ["en_US", "en_GB"]
+    assert latin["main"] == {"a": 2, "b": 2, "abc": 2}
+    assert latin["auxiliary"] == {"x": 2, "y": 2}
+    assert latin["punctuation"] == {"!": 2, "?": 2}
+
+
+def test_write_script_aggregates(tmp_path, valid_data):
+    """
+    Test the write_script_aggregates function writes sorted aggregates.
+    """
+    aggregates = {}
+    locale_data = valid_data["locales"]["en_US"]
+    exemplars.add_script_aggregate(aggregates, "en_US", locale_data)
+    exemplars.add_script_aggregate(aggregates, "en_GB", locale_data)
+    exemplars.write_script_aggregates(aggregates, "67.1", str(tmp_path))
+    with (tmp_path / "scripts.json").open("r", encoding="utf-8") as f:
+        written = json.load(f)
+    assert written["icu_version"] == "67.1"
+    assert written["scripts"]["Latn"]["locales"] == ["en_GB", "en_US"]
+
 
 def test_validate_json_data_valid(valid_data):
     """
@@ -419,3 +634,156 @@ def test_write_json_files_exception():
     with patch("pathlib.Path.mkdir", side_effect=Exception("Test Exception")):
         with pytest.raises(Exception):
             exemplars.write_json_files(data, output_dir)
+
+
+def test_write_json_files_sqlite(tmp_path, valid_data):
+    """
+    Test the write_json_files function writes the SQLite database on request.
+    """
+    exemplars.write_json_files(valid_data, str(tmp_path))
+    assert not (tmp_path / "data.sqlite").exists()
+    exemplars.write_json_files(valid_data, str(tmp_path), sqlite=True)
+    assert (tmp_path / "data.json").exists()
+    assert (tmp_path / "data.sqlite").exists()
+
+
+def test_write_json_files_codecs(tmp_path, valid_data):
+    """
+    Test the write_json_files function with several codecs and the report.
+    """
+    codecs = {"gzip": 6, "xz": 6}
+    exemplars.write_json_files(
+        valid_data, str(tmp_path / "a"), codecs=codecs, compression_report=True
+    )
+    exemplars.write_json_files(valid_data, str(tmp_path / "b"), codecs=codecs)
+    minified = (tmp_path / "a" / "data.json").read_bytes()
+    for codec, suffix in (("gzip", ".gz"), ("xz", ".xz")):
+        compressed = (tmp_path / "a" / f"data-min.json{suffix}").read_bytes()
+        assert exemplars.COMPRESSION_CODECS[codec]["decompress"](compressed) == minified
+        # the compressed files do not depend on the time they were written
+        assert compressed == (tmp_path / "b" / f"data-min.json{suffix}").read_bytes()
+    report = json.loads((tmp_path / "a" / "compression.json").read_text())
+    assert report["bytes"] == len(minified)
+    assert [entry["codec"] for entry in report["codecs"]] == ["gzip", "xz"]
+    assert report["codecs"][1]["file"] == "data-min.json.xz"
+    assert report["codecs"][1]["level"] == 6
+    assert set(report["codecs"][0]) == {
+        "codec",
+        "level",
+        "file",
+        "bytes",
+        "ratio",
+        "compress_ms",
+        "decompress_ms",
+    }
+    assert not (tmp_path / "b" / "compression.json").exists()
+
+
+def test_write_json_files_additional_codecs(tmp_path, valid_data):
+    """
+    Test that gzip is always written, and invalid levels write no files.
+    """
+    exemplars.write_json_files(valid_data, str(tmp_path / "a"), codecs={"xz": 6})
+    assert (tmp_path / "a" / "data-min.json.gz").exists()
+    assert (tmp_path / "a" / "data-min.json.xz").exists()
+    with pytest.raises(ValueError):
+        exemplars.write_json_files(valid_data, str(tmp_path / "b"), codecs={"xz": 99})
+    assert not (tmp_path / "b").exists()
+
+
+def test_parse_codecs():
+    """
+    Test the parse_codecs function with default and explicit levels.
+    """
+    assert exemplars.parse_codecs("gzip,xz:6") == {"gzip": 9, "xz": 6}
+    assert exemplars.parse_codecs("xz:0") == {"xz": 0}
+    with pytest.raises(ValueError):
+        exemplars.parse_codecs("gzip,rar")
+    with pytest.raises(ValueError):
+        exemplars.parse_codecs("gzip:42")
+    with pytest.raises(ValueError):
+        exemplars.parse_codecs("xz:99")
+    with pytest.raises(ValueError):
+        exemplars.parse_codecs("xz:fast")
+    with pytest.raises(ValueError):
+        exemplars.write_json_files({}, "test_output", codecs={"rar": 1})
+
+
+def test_main():
+    """
+    Test the command line options are passed to create_json_dump.
+    """
+    argv = ["exemplars.py", "--codecs", "gzip,xz:6", "--sqlite", "--compression-report"]
+    with patch("sys.argv", argv), patch("exemplars.create_json_dump") as mock_dump:
+        exemplars.main()
+    mock_dump.assert_called_once_with("api", True, {"gzip": 9, "xz": 6}, True)
+    with patch("sys.argv", ["exemplars.py"]), patch(
+        "exemplars.create_json_dump"
+    ) as mock_dump:
+        exemplars.main()
+    mock_dump.assert_called_once_with("api", False, None, False)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--codecs", "gzip,rar"],
+        ["--codecs", "gzip:42,xz:99"],
+        ["--codecs"],
+        ["--sqlit"],
+        ["--codec=xz"],
+    ],
+)
+def test_main_invalid_options(argv):
+    """
+    Test that unknown codecs and misspelled options are rejected.
+    """
+    with patch("sys.argv", ["exemplars.py"] + argv), patch(
+        "exemplars.create_json_dump"
+    ) as mock_dump:
+        with pytest.raises(SystemExit):
+            exemplars.main()
+    mock_dump.assert_not_called()
+
+
+def test_write_sqlite_database(tmp_path, valid_data):
+    """
+    Test the write_sqlite_database function writes the normalized tables.
+    """
+    path = tmp_path / "data.sqlite"
+    path.write_text("stale")
+    exemplars.write_sqlite_database(valid_data, str(path))
+    connection = sqlite3.connect(str(path))
+    try:
+        assert connection.execute("SELECT * FROM metadata").fetchall() == [
+            ("icu_version", "67.1")
+        ]
+        assert connection.execute("SELECT * FROM locales").fetchall() == [
+            ("en_US", "English (United States)", "en")
+        ]
+        rows = connection.execute(
+            "SELECT exemplar, codepoint, is_sequence, rank FROM exemplars "
+            "WHERE category = 'main' ORDER BY is_sequence, rank"
+        ).fetchall()
+        assert rows == [("a", 97, 0, 0), ("b", 98, 0, 1), ("abc", None, 1, 0)]
+        assert connection.execute(
+            "SELECT DISTINCT type, option FROM exemplars "
+            "WHERE category = 'case_mapping'"
+        ).fetchall() == [("main", 4)]
+        assert connection.execute(
+            "SELECT value FROM number_symbols WHERE symbol = 'decimal'"
+        ).fetchone() == (".",)
+        assert connection.execute("SELECT COUNT(*) FROM digits").fetchone() == (10,)
+        assert connection.execute("SELECT * FROM currencies").fetchall() == [
+            ("en_US", "$")
+        ]
+        indexes = {
+            row[0]
+            for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        assert "exemplars_codepoint" in indexes
+        assert "number_symbols_symbol" in indexes
+    finally:
+        connection.close()
@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import pytest
+
+import planner
+
+
+@pytest.fixture(scope="module")
+def locale_data():
+    """
+    Fixture providing the published locale data.
+    """
+    return planner.load_locale_data(
+        str(Path(__file__).parent.parent / "api" / "data-min.json.gz")
+    )
+
+
+@pytest.fixture(scope="module")
+def glyph_planner(locale_data):
+    """
+    Fixture providing a planner loaded with the published locale data.
+    """
+    return planner.GlyphSetPlanner(locale_data)
+
+
+def naive_union(locale_data, localeIDs, categories):
+    """
+    Union the exemplar lists of the locales with Python sets.
+    """
+    union = set()
+    for localeID in localeIDs:
+        for category in categories:
+            union.update(
+                planner.get_category_exemplars(
+                    locale_data["locales"][localeID], category
+                )
+            )
+    return union
+
+
+def test_bit_indexes():
+    """
+    Test the _bit_indexes function with empty and sparse bitsets.
+    """
+    assert planner._bit_indexes(0) == []
+    assert planner._bit_indexes(0b101001) == [0, 3, 5]
+    assert planner._bit_indexes(1 << 1000) == [1000]
+
+
+def test_plan_matches_naive_union(locale_data, glyph_planner):
+    """
+    Test that the planned union matches the union of the exemplar lists.
+    """
+    localeIDs = ["fr", "de", "sk", "hi", "ja", "ff_Adlm"]
+    plan = glyph_planner.plan(localeIDs)
+    expected = naive_union(locale_data, localeIDs, planner.DEFAULT_CATEGORIES)
+    assert set(plan["single_chars"]) | set(plan["sequences"]) == expected
+    assert list(plan["codepoints"]) == sorted(plan["codepoints"])
+    assert plan["codepoints"] == tuple(ord(char) for char in plan["single_chars"])
+    assert "ch" in plan["sequences"]
+    assert plan["locales"] == tuple(sorted(localeIDs))
+
+
+def test_plan_all_locales(locale_data, glyph_planner):
+    """
+    Test the plan for all locales and all categories.
+    """
+    plan = glyph_planner.plan(locale_data["locales"], planner.CATEGORIES)
+    expected = naive_union(locale_data, locale_data["locales"], planner.CATEGORIES)
+    assert len(plan["single_chars"]) + len(plan["sequences"]) == len(expected)
+    assert len(plan["marginal"]) == len(locale_data["locales"])
+
+
+def test_plan_marginal_cost(locale_data, glyph_planner):
+    """
+    Test that the marginal cost counts the exemplars only required by a locale.
+    """
+    localeIDs = ["en", "fr", "ru", "uk"]
+    plan = glyph_planner.plan(localeIDs, ["main"])
+    for localeID, count in plan["marginal"]:
+        others = [other for other in localeIDs if other != localeID]
+        own = naive_union(locale_data, [localeID], ["main"])
+        assert count == len(own - naive_union(locale_data, others, ["main"]))
+    counts = [count for _, count in plan["marginal"]]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_plan_memoized(glyph_planner):
+    """
+    Test that repeated locale lists return the memoized plan.
+    """
+    plan = glyph_planner.plan(["fr", "de-CH", "fr"])
+    assert glyph_planner.plan(["de_CH", "fr"]) is plan
+    assert glyph_planner.plan(["de_CH", "fr"], ["main"]) is not plan
+
+
+def test_plan_read_only(glyph_planner):
+    """
+    Test that callers cannot modify the memoized plan.
+    """
+    plan = glyph_planner.plan(["fr", "de"])
+    single_chars = plan["single_chars"]
+    with pytest.raises(TypeError):
+        plan["single_chars"] = ()
+    with pytest.raises(AttributeError):
+        plan["single_chars"].append("x")
+    assert glyph_planner.plan(["de", "fr"])["single_chars"] == single_chars
+
+
+def test_plan_invalid_locale(glyph_planner):
+    """
+    Test the plan function with an unavailable locale.
+    """
+    with pytest.raises(ValueError):
+        glyph_planner.plan(["invalid-locale"])
+
+
+def test_plan_invalid_category(glyph_planner):
+    """
+    Test the plan function with an invalid category.
+    """
+    with pytest.raises(ValueError):
+        glyph_planner.plan(["fr"], ["index"])
@@ -0,0 +1,116 @@
+import gzip
+import json
+
+import pytest
+
+import resolver
+
+
+@pytest.fixture
+def table():
+    """
+    Fixture providing a small resolution table.
+    """
+    return {
+        "en": "en",
+        "en_us": "en_US",
+        "en_latn_us": "en_US",
+        "pt_br": "pt_BR",
+        "sr_latn": "sr_Latn",
+        "zh_tw": "zh_Hant_TW",
+    }
+
+
+def test_resolution_key():
+    """
+    Test the resolution_key function with various locale tags.
+    """
+    assert resolver.resolution_key("en") == "en"
+    assert resolver.resolution_key("pt-BR") == "pt_br"
+    assert resolver.resolution_key("zh_Hant_TW") == "zh_hant_tw"
+    assert resolver.resolution_key("en-US-u-ca-gregory") == "en_us"
+    assert resolver.resolution_key("de-CH-x-private") == "de_ch"
+    assert resolver.resolution_key("en_US@calendar=gregorian") == "en_us"
+    assert resolver.resolution_key("en_US.UTF-8") == "en_us"
+    assert resolver.resolution_key("ca-ES-valencia") == "ca_es_valencia"
+    assert resolver.resolution_key("") == ""
+
+
+def test_resolve(table):
+    """
+    Test the resolve function with tags in the table.
+    """
+    locale_resolver = resolver.LocaleResolver(table)
+    assert locale_resolver.resolve("en-Latn-US") == "en_US"
+    assert locale_resolver.resolve("PT-br") == "pt_BR"
+    assert locale_resolver.resolve("zh-TW") == "zh_Hant_TW"
+
+
+def test_resolve_fallback(table):
+    """
+    Test the resolve function falls back by removing the last subtag.
+    """
+    locale_resolver = resolver.LocaleResolver(table)
+    assert locale_resolver.resolve("en-US-posix") == "en_US"
+    assert locale_resolver.resolve("en-GB") == "en"
+    assert locale_resolver.resolve("sr-Latn-XK") == "sr_Latn"
+    assert locale_resolver.resolve("en-GB", fallback=False) is None
+    assert locale_resolver.resolve("xx-YY") is None
+    assert locale_resolver.resolve("") is None
+
+
+def test_resolve_script_fallback():
+    """
+    Test that the fallback does not remove a script other than the likely script.
+    """
+    locale_resolver = resolver.LocaleResolver(
+        {"ru": "ru", "az": "az", "az_cyrl": "az_Cyrl"},
+        {"ru": "Cyrl", "az": "Latn"},
+    )
+    assert locale_resolver.resolve("ru-Latn") is None
+    assert locale_resolver.resolve("ru-Latn-RU") is None
+    assert locale_resolver.resolve("az-Arab") is None
+    assert locale_resolver.resolve("ru-Cyrl-RU") == "ru"
+    assert locale_resolver.resolve("az-Latn-AZ") == "az"
+    assert locale_resolver.resolve("az-Cyrl-AZ") == "az_Cyrl"
+    # without likely scripts, script subtags are never removed
+    assert resolver.LocaleResolver({"ru": "ru"}).resolve("ru-Cyrl") is None
+
+
+def test_resolve_cached(table):
+    """
+    Test that resolutions are cached.
+    """
+    locale_resolver = resolver.LocaleResolver(table, cache_size=8)
+    locale_resolver.resolve("pt-br")
+    locale_resolver.resolve("pt-br")
+    assert locale_resolver.resolve.cache_info().hits == 1
+
+
+def test_from_file(tmp_path, table):
+    """
+    Test loading a resolver from JSON and gzip compressed JSON files.
+    """
+    path = tmp_path / "resolution.json"
+    path.write_text(
+        json.dumps(
+            {"icu_version": "67.1", "locales": table, "scripts": {"sr": "Cyrl"}}
+        )
+    )
+    locale_resolver = resolver.LocaleResolver.from_file(str(path))
+    assert locale_resolver.resolve("pt-br") == "pt_BR"
+    assert locale_resolver.scripts == {"sr": "cyrl"}
+    gz_path = tmp_path / "resolution.json.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as f:
+        json.dump({"icu_version": "67.1", "locales": table}, f)
+    assert resolver.LocaleResolver.from_file(str(gz_path)).table == table
+
+
+def test_from_locale_ids():
+    """
+    Test a resolver built from the locale IDs only.
+    """
+    locale_resolver = resolver.LocaleResolver.from_locale_ids(["pt_BR", "sr_Cyrl"])
+    assert locale_resolver.resolve("pt-br") == "pt_BR"
+    assert locale_resolver.resolve("SR-CYRL-RS") == "sr_Cyrl"
+    assert locale_resolver.resolve("zh-TW") is None
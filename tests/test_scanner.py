@@ -0,0 +1,186 @@
+import unicodedata
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import scanner
+
+
+@pytest.fixture
+def locale_data():
+    """
+    Fixture providing locale data with single characters and sequences.
+    """
+    numbers = {"digits": ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]}
+    return {
+        "icu_version": "67.1",
+        "locales": {
+            "xx": {
+                "main": {"single_chars": ["a", "b", "c", "é"], "sequences": ["ch"]},
+                "auxiliary": {"single_chars": ["x"], "sequences": None},
+                "punctuation": [".", ","],
+                "case_insensitive": {"single_chars": None, "sequences": None},
+                "case_mapping": {"single_chars": None, "sequences": None},
+                "numbers": numbers,
+                "currency": None,
+            },
+            "yy": {
+                "main": {"single_chars": ["a", "h"], "sequences": None},
+                "auxiliary": {"single_chars": None, "sequences": None},
+                "punctuation": None,
+                "case_insensitive": {"single_chars": None, "sequences": None},
+                "case_mapping": {"single_chars": None, "sequences": None},
+                "numbers": numbers,
+                "currency": None,
+            },
+        },
+        "display_names": {"xx": "XX", "yy": "YY"},
+    }
+
+
+def naive_counts(text, locale_data, localeID):
+    """
+    Count non-exemplar characters with a character by character list scan.
+    """
+    allowed = []
+    for category in scanner.DEFAULT_CATEGORIES:
+        allowed += scanner.get_category_exemplars(
+            locale_data["locales"][localeID], category
+        )
+    counts = Counter()
+    for char in text:
+        if char not in allowed and not char.isspace():
+            counts[char] += 1
+    return counts
+
+
+def test_build_membership_table(locale_data):
+    """
+    Test the build_membership_table function with the default categories.
+    """
+    table = scanner.build_membership_table(locale_data["locales"]["xx"])
+    assert table["chars"] == frozenset("abcéx.,0123456789")
+    assert table["sequences"] == ("ch",)
+
+
+def test_build_membership_table_nfd(locale_data):
+    """
+    Test that decomposed exemplars become sequences with NFD normalization.
+    """
+    table = scanner.build_membership_table(
+        locale_data["locales"]["xx"], normalization="NFD"
+    )
+    assert "é" not in table["chars"]
+    assert table["sequences"] == ("ch", "e\u0301")
+
+
+def test_build_membership_tables_invalid_locale(locale_data):
+    """
+    Test the build_membership_tables function with an unavailable locale.
+    """
+    with pytest.raises(ValueError):
+        scanner.build_membership_tables(locale_data, ["zz"])
+
+
+def test_build_membership_table_invalid_category(locale_data):
+    """
+    Test the build_membership_table function with an invalid category.
+    """
+    with pytest.raises(ValueError):
+        scanner.build_membership_table(locale_data["locales"]["xx"], ["index"])
+
+
+def test_count_nonexemplars_sequences(locale_data):
+    """
+    Test that sequence characters are only allowed as part of the sequence.
+    """
+    tables = scanner.build_membership_tables(locale_data, ["xx", "yy"])
+    counts = {}
+    scanner.count_nonexemplars("chah h, q\n", tables, counts)
+    assert counts["xx"] == Counter({"h": 2, "q": 1})
+    assert counts["yy"] == Counter({"c": 1, ",": 1, "q": 1})
+
+
+def test_scan_files_normalization(tmp_path, locale_data):
+    """
+    Test that decomposed text is normalized before the lookup.
+    """
+    path = tmp_path / "corpus.txt"
+    path.write_text(unicodedata.normalize("NFD", "é ê\n"), encoding="utf-8")
+    report = scanner.scan_files([path], locale_data, ["xx"], processes=1)
+    assert report["locales"]["xx"] == {"ê": 1}
+    report = scanner.scan_files(
+        [path], locale_data, ["xx"], normalization="NFD", processes=1
+    )
+    assert report["locales"]["xx"] == {"e": 1, "\u0302": 1}
+
+
+def test_scan_files_byte_ranges(tmp_path, locale_data):
+    """
+    Test that small byte ranges and buffers give the same counts as one scan.
+    """
+    text = "".join(f"chach {i} ñé ü — Щ\n" for i in range(500))
+    path = tmp_path / "corpus.txt"
+    path.write_text(text, encoding="utf-8")
+    expected = naive_counts(text.replace("ch", " "), locale_data, "xx")
+
+    report = scanner.scan_files(
+        [path], locale_data, ["xx"], processes=1, range_size=97, buffer_size=13
+    )
+    assert report["locales"]["xx"] == dict(expected)
+    assert report["bytes"] == path.stat().st_size
+    assert report["files"] == 1
+
+
+def test_scan_files_long_line(tmp_path, locale_data):
+    """
+    Test that ranges within a long line are skipped with bounded reads.
+    """
+    text = "chach ñé ü Щ " * 5000
+    path = tmp_path / "corpus.txt"
+    path.write_text(text, encoding="utf-8")
+    tables = scanner.build_membership_tables(locale_data, ["xx"])
+    counts, scanned = scanner.scan_byte_range(
+        str(path), 1000, 2000, tables, buffer_size=64
+    )
+    assert scanned == 0
+    assert counts["xx"] == {}
+
+    report = scanner.scan_files(
+        [path], locale_data, ["xx"], processes=1, range_size=4096, buffer_size=64
+    )
+    expected = naive_counts(text.replace("ch", " "), locale_data, "xx")
+    assert report["locales"]["xx"] == dict(expected)
+    assert report["bytes"] == path.stat().st_size
+
+
+def test_scan_files_processes(tmp_path, locale_data):
+    """
+    Test that the worker processes give the same report as a single process.
+    """
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"corpus{i}.txt"
+        path.write_text("bach Ärger ½\n" * (i + 1) * 200, encoding="utf-8")
+        paths.append(path)
+    single = scanner.scan_files(paths, locale_data, ["xx", "yy"], processes=1)
+    multi = scanner.scan_files(
+        paths, locale_data, ["xx", "yy"], processes=2, range_size=512
+    )
+    assert single["locales"] == multi["locales"]
+    assert single["bytes"] == multi["bytes"] == sum(p.stat().st_size for p in paths)
+    assert multi["throughput_mb_s"] > 0
+
+
+def test_scan_files_locale_data():
+    """
+    Test the scan_files function with the published locale data.
+    """
+    data = scanner.load_locale_data(
+        str(Path(__file__).parent.parent / "api" / "data-min.json.gz")
+    )
+    path = Path(__file__)
+    report = scanner.scan_files([path], data, ["en", "ru"], processes=1)
+    assert "q" not in report["locales"]["en"]
+    assert "q" in report["locales"]["ru"]
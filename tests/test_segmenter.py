@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import pytest
+
+import segmenter
+from scanner import load_locale_data
+
+
+@pytest.fixture(scope="module")
+def locale_data():
+    """
+    Fixture providing the published locale data.
+    """
+    return load_locale_data(
+        str(Path(__file__).parent.parent / "api" / "data-min.json.gz")
+    )
+
+
+def naive_segment(text, exemplars, ignore):
+    """
+    Segment a text by trying the exemplars longest first at every position.
+    """
+    by_length = sorted(exemplars, key=len, reverse=True)
+    segments = []
+    pos = 0
+    while pos < len(text):
+        if text[pos] in ignore:
+            pos += 1
+            continue
+        for exemplar in by_length:
+            if text.startswith(exemplar, pos):
+                segments.append((pos, pos + len(exemplar), True))
+                pos += len(exemplar)
+                break
+        else:
+            if segments and not segments[-1][2] and segments[-1][1] == pos:
+                segments[-1] = (segments[-1][0], pos + 1, False)
+            else:
+                segments.append((pos, pos + 1, False))
+            pos += 1
+    return segments
+
+
+def test_longest_match():
+    """
+    Test that sequences are matched longest first, with fallback to prefixes.
+    """
+    matcher = segmenter.ExemplarMatcher(["a", "c", "d", "ch", "dz", "dzs", "abc"])
+    assert matcher.max_length == 3
+    assert matcher.match("dzsa") == 3
+    assert matcher.match("dzx") == 2
+    assert matcher.match("abx") == 1
+    assert matcher.match("xa") == 0
+    assert matcher.match("xa", 1) == 2
+    text = "chdzsabcab x"
+    units = [text[start:end] for start, end, _ in matcher.segment(text)]
+    assert units == ["ch", "dzs", "abc", "a", "b", "x"]
+
+
+def test_find_nonexemplars():
+    """
+    Test the non-exemplar spans with special characters and ignored whitespace.
+    """
+    matcher = segmenter.ExemplarMatcher(["a", "]", "^", "-", "\\", "ab"])
+    text = "ab]^-\\ x yy\tbz a"
+    assert matcher.find_nonexemplars(text) == [(7, 8), (9, 11), (12, 14)]
+    assert [span for span in matcher.segment(text) if not span[2]] == [
+        (7, 8, False),
+        (9, 11, False),
+        (12, 14, False),
+    ]
+    assert matcher.is_exemplar_text("ab ^\n-")
+    assert not matcher.is_exemplar_text("abc")
+    assert matcher.is_exemplar_text("")
+
+    strict = segmenter.ExemplarMatcher(["a"], ignore="")
+    assert strict.find_nonexemplars("a a") == [(1, 2)]
+    empty = segmenter.ExemplarMatcher([])
+    assert empty.find_nonexemplars("ab c") == [(0, 2), (3, 4)]
+
+
+def test_is_exemplar_text_longest_match():
+    """
+    Test that is_exemplar_text agrees with segment instead of trying shorter units.
+    """
+    matcher = segmenter.ExemplarMatcher(["a", "ab", "bc"])
+    assert matcher.segment("abc") == [(0, 2, True), (2, 3, False)]
+    assert not matcher.is_exemplar_text("abc")
+    assert matcher.is_exemplar_text("ab a")
+
+
+def test_is_exemplar_text_long_whitespace():
+    """
+    Test that a failed check after a long whitespace run does not backtrack.
+    """
+    matcher = segmenter.ExemplarMatcher(["a"])
+    text = " " * 100000 + "X"
+    assert not matcher.is_exemplar_text(text)
+    assert matcher.find_nonexemplars(text) == [(100000, 100001)]
+
+
+@pytest.mark.parametrize("localeID", ["sk", "hu", "cy", "as", "ln", "ja"])
+def test_segment_matches_naive(locale_data, localeID):
+    """
+    Test that the compiled matcher segments like the naive longest match.
+    """
+    matcher = segmenter.get_matcher(locale_data, localeID)
+    exemplars = set()
+    for category in segmenter.DEFAULT_CATEGORIES:
+        exemplars.update(
+            segmenter.get_category_exemplars(locale_data["locales"][localeID], category)
+        )
+    text = " ".join(sorted(exemplars)) + " Ω" + "".join(sorted(exemplars)) + "Жx☃"
+    expected = naive_segment(text, exemplars, segmenter.DEFAULT_IGNORE)
+    assert matcher.segment(text) == expected
+    assert matcher.find_nonexemplars(text) == [
+        (start, end) for start, end, exemplar in expected if not exemplar
+    ]
+
+
+def test_get_matcher(locale_data):
+    """
+    Test that matchers are cached and shared by locales with the same exemplars.
+    """
+    matcher = segmenter.get_matcher(locale_data, "sk")
+    assert segmenter.get_matcher(locale_data, "sk-SK") is matcher
+    assert segmenter.get_matcher(locale_data, "sk", ["main"]) is not matcher
+    assert matcher.find_nonexemplars("chlieb a dzban") == []
+    with pytest.raises(ValueError):
+        segmenter.get_matcher(locale_data, "xx")
+
+
+def test_locale_matchers_memoized(locale_data, monkeypatch):
+    """
+    Test that repeated lookups do not rebuild the exemplar set of a locale.
+    """
+    matchers = segmenter.LocaleMatchers(locale_data)
+    matcher = matchers.get_matcher("ja", ["main", "punctuation"])
+    calls = []
+    monkeypatch.setattr(
+        segmenter,
+        "get_category_exemplars",
+        lambda *args: calls.append(args) or [],
+    )
+    assert matchers.get_matcher("ja", ("main", "punctuation")) is matcher
+    assert calls == []
+    # get_matcher memoizes the lookups of the most recently used dataset
+    monkeypatch.setattr(segmenter, "_LOCALE_MATCHERS", None)
+    segmenter.get_matcher(locale_data, "ja")
+    segmenter.get_matcher(locale_data, "ja")
+    assert len(calls) == len(segmenter.DEFAULT_CATEGORIES)
+    segmenter.get_matcher(dict(locale_data), "ja")
+    assert len(calls) == 2 * len(segmenter.DEFAULT_CATEGORIES)